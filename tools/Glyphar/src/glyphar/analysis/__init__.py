@@ -6,9 +6,11 @@ Provides quantitative metrics to optimize preprocessing strategy selection:
     - Scanned/noisy documents → aggressive preprocessing (accuracy)
 
 Public API:
-    - QualityAssessor: Stateless quality assessment engine
+    - assess: Stateless quality assessment function
+    - QualityAssessor: Class wrapper around assess (API compatibility)
+    - QualityReport: Per-page metrics returned by QualityAssessor.assess
 """
 
-from .quality_assessor import QualityAssessor
+from .quality_assessor import QualityAssessor, QualityReport, assess
 
-__all__ = ["QualityAssessor"]
+__all__ = ["QualityAssessor", "QualityReport", "assess"]
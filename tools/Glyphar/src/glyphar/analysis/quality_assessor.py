@@ -17,9 +17,8 @@ Critical insight:
     the pipeline to skip unnecessary steps for 60-70% of modern documents.
 
 Example usage:
-    >>> assessor = QualityAssessor()
-    >>> metrics = assessor.assess(cv2.imread("page.png"))
-    >>> if metrics["is_clean_digital"]:
+    >>> metrics = assess(cv2.imread("page.png"))
+    >>> if metrics.is_clean_digital:
     ...     # Skip heavy preprocessing — use raw grayscale only
     ...     pipeline = [GrayscaleStrategy()]
     ... else:
@@ -31,12 +30,155 @@ Example usage:
     ...     ]
 """
 
-from typing import Dict, Any, Union
+from typing import Any, Iterator, NamedTuple, Union
 import cv2
 import numpy as np
 
 
-# pylint: disable=too-few-public-methods,no-member
+# 4-neighbour Laplacian (identical to cv2.Laplacian with ksize=1), built once
+# so assess() goes straight to filter2D's 3x3 fast path.
+_LAPLACIAN_KERNEL = np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32)
+
+# is_clean_digital gates, empirically tuned on Portuguese documents
+SHARPNESS_THRESHOLD = 150.0
+CONTRAST_THRESHOLD = 0.4
+
+
+class QualityReport(NamedTuple):
+    """
+    Per-page metrics returned by assess (and QualityAssessor.assess).
+
+    A NamedTuple keeps the per-page result allocation-light (no per-call
+    dict, attribute access by slot offset) and picklable for process pools.
+    Read-only mapping access (``report["sharpness"]``, ``report.get(...)``,
+    ``keys()``) is kept so Mapping-based consumers such as
+    ConfigStrategy.decide accept it unchanged.
+    """
+
+    sharpness: float
+    contrast: float
+    intensity_variance: float
+    is_clean_digital: bool
+    quality_score: float
+
+    def __getitem__(self, key: Any) -> Any:  # type: ignore[override]
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-style lookup; returns default for unknown metric names."""
+        return getattr(self, key, default) if key in self._fields else default
+
+    def keys(self) -> Iterator[str]:
+        """Metric names, in field order."""
+        return iter(self._fields)
+
+
+# pylint: disable=no-member
+def assess(
+    image: Union[np.ndarray, Any],
+    sharpness_threshold: float = SHARPNESS_THRESHOLD,
+    contrast_threshold: float = CONTRAST_THRESHOLD,
+) -> QualityReport:
+    """
+    Perform rapid quality assessment on document image.
+
+    Args:
+        image: Input image as numpy array (BGR color or grayscale).
+            Supported dtypes: uint8 (standard), uint16 (high-bit scans).
+        sharpness_threshold: is_clean_digital sharpness gate (default 150.0;
+            overridden by per-document calibration).
+        contrast_threshold: is_clean_digital contrast gate (default 0.4).
+
+    Returns:
+        QualityReport with quality metrics (attribute or key access):
+            - sharpness: Laplacian variance score (float).
+                > 150 = sharp text suitable for direct OCR.
+                < 50 = blurry text requiring denoising/sharpening.
+            - contrast: Michelson contrast ratio (float, 0.0-1.0).
+                > 0.4 = high contrast (digital documents).
+                < 0.2 = low contrast (poor scans, needs enhancement).
+            - intensity_variance: Global gray-level variance (float).
+                Near 0 = blank/uniform page.
+            - is_clean_digital: Boolean classification flag.
+                True = document qualifies for minimal preprocessing.
+                False = document requires aggressive preprocessing.
+            - quality_score: Composite metric (sharpness × contrast).
+                Higher values = easier OCR recognition.
+                Used for page difficulty ranking in batch processing.
+
+    Example:
+        >>> import cv2
+        >>> image = cv2.imread("digital_pdf_page.png")
+        >>> metrics = assess(image)
+        >>> print(f"Sharpness: {metrics.sharpness:.1f}")
+        >>> print(f"Contrast: {metrics.contrast:.2f}")
+        >>> print(f"Clean digital: {metrics.is_clean_digital}")
+        Sharpness: 210.5
+        Contrast: 0.62
+        Clean digital: True
+
+    Implementation details:
+        - Sharpness: Computed via Laplacian variance (sensitive to text stroke edges)
+          at native resolution (exact CV_16S/CV_32F buffer + cv2.meanStdDev)
+        - Contrast: Michelson formula = (max - min) / (max + min)
+        - Intensity variance: cv2.meanStdDev over the gray plane (~0.3ms)
+        - Thresholds: 150 sharpness + 0.4 contrast validated on Portuguese texts
+        - Safety: 1e-6 epsilon prevents division-by-zero on uniform images
+
+    Note:
+        This function is intentionally stateless for thread safety and minimal overhead.
+        No caching or persistent state is maintained between calls.
+    """
+    # Convert to grayscale if color image provided
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+
+    # Contrast assessment via Michelson formula
+    # Robust to absolute intensity shifts, focuses on relative differences.
+    # minMaxLoc finds both extremes
+    # in a single vectorized pass (vs two separate NumPy reductions).
+    min_val, max_val, _, _ = cv2.minMaxLoc(gray)
+    contrast = (max_val - min_val) / (
+        max_val + min_val + 1e-6
+    )  # Epsilon prevents div/0
+
+    # Intensity variance ("autofocus" screening metric): one SIMD pass via
+    # meanStdDev, an order of magnitude cheaper than the Laplacian below.
+    _, intensity_std = cv2.meanStdDev(gray)
+    intensity_variance = float(intensity_std[0, 0]) ** 2
+
+    # Sharpness assessment via Laplacian variance
+    # Higher values indicate crisper text edges (ideal for OCR).
+    # The uint8 3x3 stencil yields integers in [-1020, 1020], so CV_16S is
+    # exact at 2 bytes/pixel (vs 8 for CV_64F) and runs on OpenCV's int16
+    # SIMD path; uint16 scans need CV_32F (still exact, below 2**24).
+    ddepth = cv2.CV_16S if gray.dtype == np.uint8 else cv2.CV_32F
+    laplacian = cv2.filter2D(gray, ddepth, _LAPLACIAN_KERNEL)
+    _, std_dev = cv2.meanStdDev(laplacian)
+    laplacian_var = float(std_dev[0, 0]) ** 2
+
+    # Classification: digital-born documents have both high sharpness AND high contrast
+    # Thresholds empirically determined from 10k+ Portuguese document samples
+    is_clean_digital = bool(
+        laplacian_var > sharpness_threshold and contrast > contrast_threshold
+    )
+
+    return QualityReport(
+        sharpness=laplacian_var,
+        contrast=float(contrast),
+        intensity_variance=intensity_variance,
+        is_clean_digital=is_clean_digital,
+        quality_score=float(laplacian_var * contrast),  # Composite difficulty metric
+    )
+
+
+# pylint: disable=too-few-public-methods
 class QualityAssessor:
     """
     Assesses document image quality to determine optimal OCR preprocessing strategy.
@@ -52,6 +194,8 @@ class QualityAssessor:
             * contrast > 0.4 (Michelson ratio threshold)
         - These thresholds empirically validated on 10k+ Portuguese documents
 
+    Thin wrapper over the module-level ``assess`` function.
+
     Performance:
         - Execution time: < 3ms per page (2000px width) on Intel i5
         - Memory overhead: negligible (operates on existing image buffer)
@@ -63,78 +207,8 @@ class QualityAssessor:
         - Assumes text is darker than background (inverted documents require pre-flip)
     """
 
-    @staticmethod
-    def assess(image: Union[np.ndarray, Any]) -> Dict[str, float]:
-        """
-        Perform rapid quality assessment on document image.
-
-        Args:
-            image: Input image as numpy array (BGR color or grayscale).
-                Supported dtypes: uint8 (standard), uint16 (high-bit scans).
-
-        Returns:
-            Dictionary with quality metrics:
-                - sharpness: Laplacian variance score (float).
-                    > 150 = sharp text suitable for direct OCR.
-                    < 50 = blurry text requiring denoising/sharpening.
-                - contrast: Michelson contrast ratio (float, 0.0-1.0).
-                    > 0.4 = high contrast (digital documents).
-                    < 0.2 = low contrast (poor scans, needs enhancement).
-                - is_clean_digital: Boolean classification flag.
-                    True = document qualifies for minimal preprocessing.
-                    False = document requires aggressive preprocessing.
-                - quality_score: Composite metric (sharpness × contrast).
-                    Higher values = easier OCR recognition.
-                    Used for page difficulty ranking in batch processing.
-
-        Example:
-            >>> import cv2
-            >>> image = cv2.imread("digital_pdf_page.png")
-            >>> metrics = QualityAssessor.assess(image)
-            >>> print(f"Sharpness: {metrics['sharpness']:.1f}")
-            >>> print(f"Contrast: {metrics['contrast']:.2f}")
-            >>> print(f"Clean digital: {metrics['is_clean_digital']}")
-            Sharpness: 210.5
-            Contrast: 0.62
-            Clean digital: True
-
-        Implementation details:
-            - Sharpness: Computed via Laplacian variance (sensitive to text stroke edges)
-            - Contrast: Michelson formula = (max - min) / (max + min)
-            - Thresholds: 150 sharpness + 0.4 contrast validated on Portuguese texts
-            - Safety: 1e-6 epsilon prevents division-by-zero on uniform images
-
-        Note:
-            This method is intentionally stateless for thread safety and minimal overhead.
-            No caching or persistent state is maintained between calls.
-        """
-        # Convert to grayscale if color image provided
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-
-        # Sharpness assessment via Laplacian variance
-        # Higher values indicate crisper text edges (ideal for OCR)
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
-
-        # Contrast assessment via Michelson formula
-        # Robust to absolute intensity shifts, focuses on relative differences
-        min_val = float(gray.min())
-        max_val = float(gray.max())
-        contrast = (max_val - min_val) / (
-            max_val + min_val + 1e-6
-        )  # Epsilon prevents div/0
-
-        # Classification: digital-born documents have both high sharpness AND high contrast
-        # Thresholds empirically determined from 10k+ Portuguese document samples
-        is_clean_digital = laplacian_var > 150.0 and contrast > 0.4
-
-        return {
-            "sharpness": float(laplacian_var),
-            "contrast": float(contrast),
-            "is_clean_digital": is_clean_digital,
-            "quality_score": float(
-                laplacian_var * contrast
-            ),  # Composite difficulty metric
-        }
+    SHARPNESS_THRESHOLD = SHARPNESS_THRESHOLD
+    CONTRAST_THRESHOLD = CONTRAST_THRESHOLD
+
+    # Kept for API compatibility; hot paths call the module-level function.
+    assess = staticmethod(assess)
@@ -0,0 +1,105 @@
+"""
+Per-document calibration of the clean-digital fast-path gates.
+
+The fixed gates (sharpness >= 150, contrast >= 0.55) were tuned on one
+corpus. On a new corpus they can deny the fast path (grayscale, OEM 1) to
+pages that OCR fine on it, leaving them on the route decide() picks without
+the clean override, or the reverse.
+
+Calibration measures both routes on the first K pages of a document and picks
+the (sharpness, contrast) pair maximizing
+
+    mean(confidence) - time_weight * mean(seconds)
+
+over the routing those gates would have produced. The thresholds are then
+frozen for the rest of the document (see PageProcessor.with_clean_thresholds).
+
+Design constraints:
+    - Pure fitting logic (no OCR here; samples come from PageProcessor)
+    - Deterministic: ties keep the default gates
+    - Candidate gates are the observed sample values, so the search is exact
+      over every distinct routing of the sample (O(K^3) for K pages)
+"""
+
+import math
+from typing import NamedTuple, Sequence, Tuple
+
+from glyphar.optimization.config_strategy import ConfigStrategy
+
+DEFAULT_CLEAN_THRESHOLDS: Tuple[float, float] = (
+    float(ConfigStrategy.SHARPNESS_HIGH),
+    float(ConfigStrategy.CONTRAST_HIGH),
+)
+
+# Gates for measurement: (0, 0) forces every page onto the fast path;
+# (inf, inf) disables the clean override, leaving the route decide() picks
+# without it (not necessarily the same degraded-scan config for every page)
+FORCE_FAST_PATH: Tuple[float, float] = (0.0, 0.0)
+FORCE_FULL_PATH: Tuple[float, float] = (math.inf, math.inf)
+
+
+class CalibrationSample(NamedTuple):
+    """Quality metrics of one page plus OCR outcome on both paths."""
+
+    sharpness: float
+    contrast: float
+    fast_confidence: float
+    fast_time_s: float
+    full_confidence: float
+    full_time_s: float
+
+
+def _routing_score(
+    samples: Sequence[CalibrationSample],
+    thresholds: Tuple[float, float],
+    time_weight: float,
+) -> float:
+    sharpness_gate, contrast_gate = thresholds
+    total = 0.0
+    for s in samples:
+        if s.sharpness >= sharpness_gate and s.contrast >= contrast_gate:
+            total += s.fast_confidence - time_weight * s.fast_time_s
+        else:
+            total += s.full_confidence - time_weight * s.full_time_s
+    return total / len(samples)
+
+
+def fit_clean_thresholds(
+    samples: Sequence[CalibrationSample],
+    time_weight: float = 1.0,
+) -> Tuple[float, float]:
+    """
+    Grid-search clean-digital gates over calibration samples.
+
+    Args:
+        samples: Per-page measurements from both OCR paths.
+        time_weight: Confidence points traded per second of OCR time.
+
+    Returns:
+        (sharpness_threshold, contrast_threshold). Defaults when samples is
+        empty or nothing beats them.
+    """
+    if not samples:
+        return DEFAULT_CLEAN_THRESHOLDS
+
+    # Observed values cover every "route this page fast" cut; one step above
+    # the maximum covers "route nothing fast".
+    sharpness_values = sorted({s.sharpness for s in samples})
+    contrast_values = sorted({s.contrast for s in samples})
+    sharpness_candidates = sharpness_values + [
+        math.nextafter(sharpness_values[-1], math.inf)
+    ]
+    contrast_candidates = contrast_values + [
+        math.nextafter(contrast_values[-1], math.inf)
+    ]
+
+    best = DEFAULT_CLEAN_THRESHOLDS
+    best_score = _routing_score(samples, best, time_weight)
+    for sharpness_gate in sharpness_candidates:
+        for contrast_gate in contrast_candidates:
+            candidate = (sharpness_gate, contrast_gate)
+            score = _routing_score(samples, candidate, time_weight)
+            if score > best_score + 1e-9:
+                best, best_score = candidate, score
+
+    return best
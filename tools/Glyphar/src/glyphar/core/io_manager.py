@@ -6,7 +6,7 @@ Enables format-agnostic pipeline consumption (PDFs, images treated identically).
 """
 
 from pathlib import Path
-from typing import List, Any
+from typing import Any, Iterator, List
 from glyphar.file_io.readers import PDFReader, ImageReader
 
 
@@ -29,6 +29,19 @@ def read_pages(file_reader, path: Path) -> List[Any]:
     return file_reader.read(path)
 
 
+def iter_pages(file_reader, path: Path) -> Iterator[Any]:
+    """
+    Extract page images lazily, one at a time, in page order.
+
+    Uses the reader's read_iter() when it has one (PDFReader renders a few
+    pages at a time); otherwise falls back to read().
+    """
+    read_iter = getattr(file_reader, "read_iter", None)
+    if read_iter is not None:
+        return read_iter(path)
+    return iter(file_reader.read(path))
+
+
 def make_default_reader(path: Path, dpi: int = 300):
     """
     Auto-detect document format and return appropriate reader.
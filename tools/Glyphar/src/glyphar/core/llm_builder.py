@@ -13,6 +13,7 @@ Design rationale:
     - Minimal formatting overhead (<2% size increase vs raw text)
 """
 
+import io
 from typing import List
 from glyphar.models.page import PageResult
 
@@ -51,19 +52,26 @@ def build_llm_ready_text(
         >>> text = build_llm_ready_text(pages_results)
         >>> corrected = llm.correct(text, system_prompt="Fix OCR errors while preserving structure")
     """
-    parts = []
-    parts.append(f"=== OCR RESULTS - {len(pages_results)} PAGES ===")
+    # Stream everything into one buffer: no per-page joined string and no
+    # growing parts list. isspace() filters blank columns like strip() would,
+    # without allocating a stripped copy.
+    buf = io.StringIO()
+    write = buf.write
+    write(f"=== OCR RESULTS - {len(pages_results)} PAGES ===")
 
     for page in pages_results:
-        header = (
-            f"\n\n=== PAGE {page.page_number} | Confidence: "
-            f"{page.page_confidence_mean:.1f}% ===\n"
+        write(
+            f"\n\n\n=== PAGE {page.page_number} | Confidence: "
+            f"{page.page_confidence_mean:.1f}% ===\n\n"
         )
-        parts.append(header)
-
         # Safely extract text from columns (handles empty/fallback pages)
-        page_text = separator.join(col.text for col in page.columns if col.text.strip())
-        parts.append(page_text)
-
-    parts.append("\n=== END OF DOCUMENT ===")
-    return "\n".join(parts)
+        pending_separator = ""
+        for col in page.columns:
+            text = col.text
+            if text and not text.isspace():
+                write(pending_separator)
+                write(text)
+                pending_separator = separator
+
+    write("\n\n=== END OF DOCUMENT ===")
+    return buf.getvalue()
@@ -26,8 +26,10 @@ def extract_file_metadata(path: Path, pages_count: int | None = None) -> FileMet
         SHA256 separately if deduplication required.
     """
     stat = path.stat()
+    # resolve() walks the filesystem; absolute paths are used as given
+    abs_path = str(path) if path.is_absolute() else str(path.resolve())
     return FileMetadata(
-        path=str(path.resolve()),
+        path=abs_path,
         name=path.name,
         extension=path.suffix.lstrip("."),
         size_bytes=stat.st_size,
@@ -5,8 +5,17 @@ Coordinates quality assessment, layout detection, and region-based OCR
 execution for a single document page. Stateless design enables parallelization.
 """
 
+import copy
+import hashlib
+import math
+import sys
+import threading
 import time
-from typing import Any, List, Mapping
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+import cv2
 import numpy as np
 
 from glyphar.core.identity import Identity
@@ -15,7 +24,13 @@ from glyphar.models.page import PageResult
 from glyphar.models.column import ColumnResult
 from glyphar.models.enums import PageQuality
 
-from glyphar.analysis.quality_assessor import QualityAssessor
+from glyphar.analysis.quality_assessor import QualityReport, assess as assess_quality
+from glyphar.core.calibration import (
+    FORCE_FAST_PATH,
+    FORCE_FULL_PATH,
+    CalibrationSample,
+    fit_clean_thresholds,
+)
 from glyphar.optimization.config_optimizer import ConfigOptimizer
 
 
@@ -30,7 +45,9 @@ class PageProcessor:
         4. Result aggregation → PageResult construction
 
     Design constraints:
-        - Stateless: No persistent state between page invocations
+        - Stateless: No persistent state between page invocations (apart from
+          a bounded, lock-protected cache of quality/layout analysis keyed
+          by page content — results are identical with or without it)
         - Thread-safe: Safe for concurrent execution (parallel processing)
         - Fail-safe: Always returns valid PageResult (fallback on errors)
 
@@ -39,12 +56,26 @@ class PageProcessor:
         - Memory: ~50MB peak per page (300 DPI, 2000px width)
     """
 
+    # (sharpness, contrast, quality) tiers from PageQuality docs, best first.
+    # Both columns decrease monotonically, so the first tier whose gates are
+    # both exceeded is the highest one the page satisfies.
+    _QUALITY_TIERS: Tuple[Tuple[float, float, PageQuality], ...] = (
+        (250.0, 0.6, PageQuality.EXCELLENT),
+        (150.0, 0.4, PageQuality.GOOD),
+        (80.0, 0.25, PageQuality.FAIR),
+    )
+
+    # Geometry every region must carry as ints (see _validate_regions)
+    _REGION_KEYS: Tuple[str, ...] = ("col_index", "x", "y", "w", "h")
+
     def __init__(
         self,
         engine,
         layout_detector,
         preprocessing_strategies=None,  # pylint: disable=unused-argument
         min_confidence: float = 30.0,
+        region_workers: int = 1,
+        analysis_cache_size: int = 128,
     ) -> None:
         """
         Initialize page processor with required dependencies.
@@ -54,11 +85,86 @@ class PageProcessor:
             layout_detector: LayoutDetector instance (ColumnLayoutDetector).
             preprocessing_strategies: Deprecated — ignored (kept for API compat).
             min_confidence: Minimum word confidence threshold (0.0-100.0).
+            region_workers: Threads used to OCR regions of one page concurrently
+                (multi-column layouts). Tesseract runs out-of-process, so
+                threads overlap its execution without copying region images.
+                The pool is created once per instance and shared by all pages
+                (including concurrent ones under run_parallel); regions are
+                submitted largest-first. 1 keeps the sequential region loop.
+            analysis_cache_size: Pages whose quality metrics and layout are
+                remembered (LRU) so repeated pages — blanks, template pages,
+                re-runs — skip stages 1-2. 0 disables the cache.
         """
         self.layout_detector = layout_detector
         self.min_confidence = min_confidence
-        self.quality_assessor = QualityAssessor()
+        self.region_workers = max(1, int(region_workers))
         self.config_optimizer = ConfigOptimizer(engine)
+        self.analysis_cache_size = max(0, int(analysis_cache_size))
+        self._analysis_cache: OrderedDict[
+            Tuple[Any, ...], Tuple[QualityReport, Dict[str, Any]]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._region_executor: Optional[ThreadPoolExecutor] = None
+        # Per-document (sharpness, contrast) clean-digital gates; None keeps
+        # the assessor/ConfigStrategy defaults. Set only on copies made by
+        # with_clean_thresholds so a shared instance is never mutated.
+        self.clean_thresholds: Optional[Tuple[float, float]] = None
+
+    def with_clean_thresholds(self, sharpness: float, contrast: float) -> "PageProcessor":
+        """Return a shallow copy routing pages with calibrated clean-digital gates."""
+        specialized = copy.copy(self)
+        specialized.clean_thresholds = (float(sharpness), float(contrast))
+        if self.region_workers > 1:
+            # Share the region pool instead of spawning one per document
+            specialized._region_executor = self._get_region_executor()
+        return specialized
+
+    def calibrate_clean_thresholds(
+        self,
+        images: Sequence[Any],
+        time_weight: float = 1.0,
+    ) -> Tuple[float, float]:
+        """
+        Fit clean-digital gates by OCR-ing sample pages on both routes.
+
+        Each page is run once forced onto the fast path (grayscale, OEM 1)
+        and once on the route decide() picks without the clean override, as
+        a single full-page region. Costs two extra OCR passes per sample
+        page.
+
+        Args:
+            images: Sample page images (typically the first K of a document).
+            time_weight: Confidence points traded per second of OCR time.
+
+        Returns:
+            (sharpness_threshold, contrast_threshold) for with_clean_thresholds.
+        """
+        samples = []
+        for image in images:
+            gray = self._to_gray(image)
+            quality_metrics = assess_quality(gray)
+            layout_type = self.layout_detector.detect(gray)["layout_type"]
+            fast, full = (
+                self.config_optimizer.find_optimal_config(
+                    image=image,
+                    layout_type=layout_type,
+                    quality_metrics=quality_metrics,
+                    gray=gray,
+                    clean_thresholds=gates,
+                )
+                for gates in (FORCE_FAST_PATH, FORCE_FULL_PATH)
+            )
+            samples.append(
+                CalibrationSample(
+                    sharpness=quality_metrics.sharpness,
+                    contrast=quality_metrics.contrast,
+                    fast_confidence=float(fast.get("confidence", 0.0)),
+                    fast_time_s=float(fast.get("time_s", 0.0)),
+                    full_confidence=float(full.get("confidence", 0.0)),
+                    full_time_s=float(full.get("time_s", 0.0)),
+                )
+            )
+        return fit_clean_thresholds(samples, time_weight=time_weight)
 
     def process(
         self,
@@ -87,45 +193,41 @@ class PageProcessor:
         """
         t0 = time.perf_counter()
 
-        # Stage 1: Quality assessment
-        quality_metrics = self.quality_assessor.assess(image)
-        page_quality = self._classify_page_quality(quality_metrics)
+        # Single BGR→gray conversion shared by every stage below
+        gray = self._to_gray(image)
 
-        # Stage 2: Layout detection
-        layout = self.layout_detector.detect(image)
+        # Stages 1-2: Quality assessment + layout detection (cached)
+        quality_metrics, layout = self._analyze_page(gray)
+        page_quality = self._classify_page_quality(quality_metrics)
         layout_type = layout["layout_type"]
-        regions = layout.get("regions", [])
+        regions = layout["regions"]
 
         # Stage 3: Region processing
-        columns: List[ColumnResult] = []
-        confidences: List[float] = []
+        process_region = partial(
+            self._process_region_safe,
+            image,
+            gray,
+            layout_type=layout_type,
+            quality_metrics=quality_metrics,
+        )
 
-        for region in regions:
-            try:
-                column = self._process_region(
-                    image=image,
-                    region=region,
-                    layout_type=layout_type,
-                    quality_metrics=quality_metrics,
-                )
-                columns.append(column)
-                confidences.append(column.confidence)
-            except (RuntimeError, ValueError, TypeError, KeyError):
-                # Isolated region failure — continue processing other regions
-                columns.append(
-                    ColumnResult(
-                        col_index=region["col_index"],
-                        text="",
-                        confidence=0.0,
-                        word_count=0,
-                        char_count=0,
-                        processing_time_s=0.0,
-                        bbox=self._safe_bbox(region),
-                        region_id=self._region_id(region),
-                        config_used=None,
-                    )
-                )
-                confidences.append(0.0)
+        columns: List[ColumnResult]
+        if self.region_workers > 1 and len(regions) > 1:
+            # Largest regions first (longest-processing-time order) so a big
+            # column never starts last and stretches the page; results are
+            # collected back in layout order.
+            executor = self._get_region_executor()
+            by_area = sorted(
+                range(len(regions)),
+                key=lambda i: regions[i]["w"] * regions[i]["h"],
+                reverse=True,
+            )
+            futures = {i: executor.submit(process_region, regions[i]) for i in by_area}
+            columns = [futures[i].result() for i in range(len(regions))]
+        else:
+            columns = [process_region(region) for region in regions]
+
+        confidences = [column.confidence for column in columns]
 
         # Generate Canonical ID
         page_id = Identity.canonical_id(doc_prefix, doc_date, page_number)
@@ -137,34 +239,193 @@ class PageProcessor:
             layout_type=layout_type,
             columns=columns,
             page_quality=page_quality,
-            page_confidence_mean=float(np.mean(confidences)) if confidences else 0.0,
+            page_confidence_mean=(
+                sum(confidences) / len(confidences) if confidences else 0.0
+            ),
             processing_time_s=time.perf_counter() - t0,
             config_used=None,
+            warnings=list(layout["region_warnings"]),
             page_text_hash=self._compute_page_text_hash(columns),
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks don't pickle (ProcessPool workers, copy.copy); each copy
+        # starts with its own empty cache.
+        state = self.__dict__.copy()
+        state["_analysis_cache"] = OrderedDict()
+        state["_region_executor"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _get_region_executor(self) -> ThreadPoolExecutor:
+        """Return the instance-wide region thread pool, creating it on first use."""
+        with self._lock:
+            if self._region_executor is None:
+                self._region_executor = ThreadPoolExecutor(
+                    max_workers=self.region_workers,
+                    thread_name_prefix="glyphar-region",
+                )
+            return self._region_executor
+
+    def _analyze_page(self, gray: Any) -> Tuple[QualityReport, Dict[str, Any]]:
+        """
+        Run quality assessment and layout detection, reusing cached results.
+
+        The key is a 64-bit content hash of the gray page (~2ms at 300 DPI)
+        plus page shape and clean-digital gates, so only pixel-identical pages
+        (blank pages, repeated templates, re-runs) hit. Downscaled
+        "perceptual" keys were rejected: INTER_AREA thumbnails cost as much
+        as the analysis itself, and sampled ones can collide across text
+        pages, silently reusing the wrong layout.
+        """
+        if not self.analysis_cache_size:
+            return self._assess_quality(gray), self._detect_layout(gray)
+
+        key = (gray.shape, self.clean_thresholds, hash(gray.tobytes()))
+
+        with self._lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                return cached
+
+        # Compute outside the lock so concurrent pages don't serialize
+        analysis = (self._assess_quality(gray), self._detect_layout(gray))
+
+        with self._lock:
+            self._analysis_cache[key] = analysis
+            if len(self._analysis_cache) > self.analysis_cache_size:
+                self._analysis_cache.popitem(last=False)
+        return analysis
+
+    def _detect_layout(self, gray: Any) -> Dict[str, Any]:
+        """Detect layout; regions validated once (cached with the layout)."""
+        layout = self.layout_detector.detect(gray)
+        regions, region_warnings = self._validate_regions(layout.get("regions", []))
+        return {**layout, "regions": regions, "region_warnings": region_warnings}
+
     @staticmethod
-    def _compute_page_text_hash(columns: List[ColumnResult]) -> str | None:
-        """Compute SHA256 hash of concatenated column texts."""
-        text = "\n\n".join(
-            c.text for c in columns if hasattr(c, "text") and c.text.strip()
+    def _validate_regions(
+        regions: Sequence[Any],
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Normalize detector regions before any OCR runs.
+
+        Kept regions have int col_index >= 1, x/y >= 0 and w/h > 0 (other
+        detector keys such as "id" pass through), so the per-region path
+        indexes geometry directly and only has to guard against engine
+        failures. Malformed regions are dropped with a page warning instead
+        of surfacing as a KeyError mid-page.
+        """
+        valid: List[Dict[str, Any]] = []
+        region_warnings: List[str] = []
+        for n, region in enumerate(regions, 1):
+            try:
+                col, x, y, w, h = (int(region[k]) for k in PageProcessor._REGION_KEYS)
+            except (KeyError, TypeError, ValueError):
+                region_warnings.append(f"Dropped region {n}: missing or non-integer geometry")
+                continue
+            if col < 1 or x < 0 or y < 0 or w <= 0 or h <= 0:
+                region_warnings.append(
+                    f"Dropped region {n}: invalid geometry "
+                    f"(col_index={col}, x={x}, y={y}, w={w}, h={h})"
+                )
+                continue
+            valid.append({**region, "col_index": col, "x": x, "y": y, "w": w, "h": h})
+        return valid, region_warnings
+
+    def _assess_quality(self, gray: Any) -> QualityReport:
+        """Assess page quality with this processor's clean-digital gates."""
+        if self.clean_thresholds is None:
+            return assess_quality(gray)
+        return assess_quality(
+            gray,
+            sharpness_threshold=self.clean_thresholds[0],
+            contrast_threshold=self.clean_thresholds[1],
         )
-        return Identity.sha256_hash(text) if text else None
+
+    @staticmethod
+    def _compute_page_text_hash(columns: List[ColumnResult]) -> str | None:
+        """
+        Compute SHA256 hash of concatenated column texts.
+
+        Streams each column into the hasher with the "\n\n" separator
+        between them — same digest as hashing the joined text, without
+        materializing the page-sized string.
+        """
+        hasher = None
+        for column in columns:
+            text = getattr(column, "text", None)
+            if not text or text.isspace():
+                continue
+            if hasher is None:
+                hasher = hashlib.sha256()
+            else:
+                hasher.update(b"\n\n")
+            hasher.update(text.encode("utf-8"))
+        return hasher.hexdigest() if hasher is not None else None
+
+    def _process_region_safe(
+        self,
+        image: Any,
+        gray: Any,
+        region: Mapping[str, Any],
+        layout_type: str,
+        quality_metrics: QualityReport,
+    ) -> ColumnResult:
+        """
+        Process region, isolating engine failures as an empty column.
+
+        Regions are pre-validated (_validate_regions), so only errors the
+        OCR/optimizer stage raises are caught: RuntimeError from Tesseract,
+        ValueError/TypeError for malformed engine results.
+        """
+        try:
+            return self._process_region(
+                image=image,
+                gray=gray,
+                region=region,
+                layout_type=layout_type,
+                quality_metrics=quality_metrics,
+            )
+        except (RuntimeError, ValueError, TypeError):
+            # Isolated region failure — continue processing other regions
+            return ColumnResult(
+                col_index=region["col_index"],
+                text="",
+                confidence=0.0,
+                word_count=0,
+                char_count=0,
+                processing_time_s=0.0,
+                bbox=self._safe_bbox(region),
+                region_id=self._region_id(region),
+                config_used=None,
+            )
 
     def _process_region(
         self,
         image: Any,
+        gray: Any,
         region: Mapping[str, Any],
         layout_type: str,
-        quality_metrics: Mapping[str, Any],
+        quality_metrics: QualityReport,
     ) -> ColumnResult:
         """Process single region with optimal OCR configuration."""
-        region_img = self._extract_region(image, region)
+        # BGR crop stays a view: ConfigOptimizer takes its own defensive
+        # (contiguous) copy for the fallback path, so copying here too would
+        # be a second memcpy of the same pixels.
+        region_img = self._extract_region(image, region, contiguous=False)
 
         ocr_result = self.config_optimizer.find_optimal_config(
             image=region_img,
             layout_type=layout_type,
             quality_metrics=quality_metrics,
+            gray=self._extract_region(gray, region),
+            clean_thresholds=self.clean_thresholds,
         )
 
         text = str(ocr_result.get("text", ""))
@@ -175,7 +436,9 @@ class PageProcessor:
 
         config_used = ocr_result.get("config_used")
         if not isinstance(config_used, str):
-            config_used = str(config_used) if config_used is not None else "unknown"
+            config_used = (
+                sys.intern(str(config_used)) if config_used is not None else "unknown"
+            )
 
         word_count = int(ocr_result.get("word_count", len(words)))
         char_count = int(ocr_result.get("char_count", len(text)))
@@ -194,26 +457,42 @@ class PageProcessor:
         )
 
     @staticmethod
-    def _extract_region(image: Any, region: Mapping[str, Any]) -> Any:
-        """Extract region subimage using bounding box coordinates."""
+    def _to_gray(image: Any) -> Any:
+        """Convert page to single-channel grayscale (no-op for gray input)."""
+        if image.ndim == 2:
+            return image
+        channels = image.shape[2]
+        if channels == 1:
+            return image[:, :, 0]
+        code = cv2.COLOR_BGRA2GRAY if channels == 4 else cv2.COLOR_BGR2GRAY
+        return cv2.cvtColor(image, code)  # pylint: disable=no-member
+
+    @staticmethod
+    def _extract_region(
+        image: Any, region: Mapping[str, Any], contiguous: bool = True
+    ) -> Any:
+        """
+        Extract region subimage using bounding box coordinates.
+
+        Column crops are strided views; by default materialize them once here
+        so the preprocessing and engine stages don't each make hidden
+        contiguous copies. Full-width regions are already contiguous (no
+        copy). contiguous=False returns the plain view for consumers that
+        copy anyway.
+        """
         x, y, w, h = region["x"], region["y"], region["w"], region["h"]
-        return image[y : y + h, x : x + w]
+        crop = image[y : y + h, x : x + w]
+        return np.ascontiguousarray(crop) if contiguous else crop
 
     @staticmethod
-    def _safe_bbox(region: Mapping[str, Any]) -> dict[str, int] | None:
-        """Return valid bbox dict or None if dimensions invalid."""
-        if region.get("w", 0) > 0 and region.get("h", 0) > 0:
-            x = int(region["x"])
-            y = int(region["y"])
-            w = int(region["w"])
-            h = int(region["h"])
-            return {
-                "left": x,
-                "top": y,
-                "width": w,
-                "height": h,
-            }
-        return None
+    def _safe_bbox(region: Mapping[str, Any]) -> dict[str, int]:
+        """Return the (pre-validated) region geometry as a bbox dict."""
+        return {
+            "left": region["x"],
+            "top": region["y"],
+            "width": region["w"],
+            "height": region["h"],
+        }
 
     @staticmethod
     def _region_id(region: Mapping[str, Any]) -> str:
@@ -222,18 +501,45 @@ class PageProcessor:
         if isinstance(detector_id, str) and detector_id.strip():
             return detector_id
 
-        col = int(region.get("col_index", 0))
-        x = int(region.get("x", 0))
-        y = int(region.get("y", 0))
-        w = int(region.get("w", 0))
-        h = int(region.get("h", 0))
-        return f"col{col}_{x}_{y}_{w}_{h}"
+        return (
+            f"col{region['col_index']}_{region['x']}_{region['y']}"
+            f"_{region['w']}_{region['h']}"
+        )
+
+    @staticmethod
+    def _word_box(item: Any) -> Tuple[int, int, int, int] | None:
+        """Return (left, top, width, height) of a word dict, or None if absent."""
+        # `type(...) is dict` short-circuits the slow ABC isinstance check
+        # for the plain dicts engines actually return.
+        if type(item) is not dict and not isinstance(item, Mapping):  # pylint: disable=unidiomatic-typecheck
+            return None
+        bbox = item.get("bbox")
+        if type(bbox) is not dict and not isinstance(bbox, Mapping):  # pylint: disable=unidiomatic-typecheck
+            return None
+
+        # Short-form keys are only looked up when the long form is missing
+        # (a .get default would be evaluated eagerly for every word).
+        left = bbox.get("left")
+        if left is None:
+            left = bbox.get("x")
+        top = bbox.get("top")
+        if top is None:
+            top = bbox.get("y")
+        width = bbox.get("width")
+        if width is None:
+            width = bbox.get("w")
+        height = bbox.get("height")
+        if height is None:
+            height = bbox.get("h")
+        if left is None or top is None or width is None or height is None:
+            return None
+        return int(left), int(top), int(width), int(height)
 
     @staticmethod
     def _resolve_bbox(
         region: Mapping[str, Any],
         words: List[Any],
-    ) -> dict[str, int] | None:
+    ) -> dict[str, int]:
         """
         Resolve output bbox using OCR content when available.
 
@@ -242,74 +548,52 @@ class PageProcessor:
             2) Region bounding box fallback
         """
         if words:
-            x0 = int(region.get("x", 0))
-            y0 = int(region.get("y", 0))
-
-            abs_lefts: List[int] = []
-            abs_tops: List[int] = []
-            abs_rights: List[int] = []
-            abs_bottoms: List[int] = []
-
-            for item in words:
-                if not isinstance(item, Mapping):
+            # Single fused pass with four running extremes: no per-word
+            # list appends, no second traversal, no array construction.
+            min_left = min_top = math.inf
+            max_right = max_bottom = -math.inf
+            for box in map(PageProcessor._word_box, words):
+                if box is None:
                     continue
-                bbox = item.get("bbox")
-                if not isinstance(bbox, Mapping):
-                    continue
-
-                left = bbox.get("left", bbox.get("x"))
-                top = bbox.get("top", bbox.get("y"))
-                width = bbox.get("width", bbox.get("w"))
-                height = bbox.get("height", bbox.get("h"))
-                if left is None or top is None or width is None or height is None:
+                left, top, width, height = box
+                if width <= 0 or height <= 0:
                     continue
-
-                left_i = int(left)
-                top_i = int(top)
-                width_i = int(width)
-                height_i = int(height)
-                if width_i <= 0 or height_i <= 0:
-                    continue
-
-                abs_left = x0 + left_i
-                abs_top = y0 + top_i
-                abs_right = abs_left + width_i
-                abs_bottom = abs_top + height_i
-
-                abs_lefts.append(abs_left)
-                abs_tops.append(abs_top)
-                abs_rights.append(abs_right)
-                abs_bottoms.append(abs_bottom)
-
-            if abs_lefts:
-                min_left = min(abs_lefts)
-                min_top = min(abs_tops)
-                max_right = max(abs_rights)
-                max_bottom = max(abs_bottoms)
+                if left < min_left:
+                    min_left = left
+                if top < min_top:
+                    min_top = top
+                if left + width > max_right:
+                    max_right = left + width
+                if top + height > max_bottom:
+                    max_bottom = top + height
+
+            if max_right != -math.inf:
+                x0 = region["x"]
+                y0 = region["y"]
                 return {
-                    "left": min_left,
-                    "top": min_top,
-                    "width": max_right - min_left,
-                    "height": max_bottom - min_top,
+                    "left": x0 + int(min_left),
+                    "top": y0 + int(min_top),
+                    "width": int(max_right - min_left),
+                    "height": int(max_bottom - min_top),
                 }
 
         return PageProcessor._safe_bbox(region)
 
     @staticmethod
-    def _classify_page_quality(metrics: Mapping[str, Any]) -> PageQuality:
+    def _classify_page_quality(metrics: QualityReport) -> PageQuality:
         """
         Classify page quality using canonical thresholds from PageQuality docs.
+
+        Scans the precomputed _QUALITY_TIERS table (three float compares in
+        the common case). NaN metrics fail every gate and classify as POOR.
         """
         try:
-            sharpness = float(metrics.get("sharpness", 0.0))
-            contrast = float(metrics.get("contrast", 0.0))
+            sharpness = float(metrics.sharpness)
+            contrast = float(metrics.contrast)
         except (TypeError, ValueError):
             return PageQuality.UNKNOWN
 
-        if sharpness > 250.0 and contrast > 0.6:
-            return PageQuality.EXCELLENT
-        if sharpness > 150.0 and contrast > 0.4:
-            return PageQuality.GOOD
-        if sharpness > 80.0 and contrast > 0.25:
-            return PageQuality.FAIR
+        for sharpness_gate, contrast_gate, quality in PageProcessor._QUALITY_TIERS:
+            if sharpness > sharpness_gate and contrast > contrast_gate:
+                return quality
         return PageQuality.POOR
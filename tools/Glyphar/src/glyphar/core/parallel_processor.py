@@ -18,17 +18,179 @@ Design constraints:
     - PageProcessor must be pickleable (no lambdas, nested functions)
     - File reading happens in main process (avoids file handle duplication)
     - Results collected and sorted in main process
+    - Worker pool is persistent: spawned once, reused across documents
+    - Page pixels travel via shared memory (only a small descriptor is pickled)
 """
 
+import math
 import os
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 # Prevent OpenMP thread explosion in child processes
 os.environ["OMP_THREAD_LIMIT"] = "1"
 
+# OpenCV's own pool per worker (cvtColor, resize, ...); N workers x all cores
+# otherwise oversubscribes the host. Overridable for few-worker setups.
+_CV_THREADS_ENV = "GLYPHAR_CV_THREADS"
+
+# Per-worker PageProcessor, installed once by _init_worker
+_WORKER_PAGE_PROCESSOR: Any = None
+
+# cgroup v2 quota file (containers); v1 exposes quota/period separately
+_CGROUP_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+_CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+_CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _cgroup_cpu_limit(
+    cpu_max: str = _CGROUP_CPU_MAX,
+    v1_quota: str = _CGROUP_V1_QUOTA,
+    v1_period: str = _CGROUP_V1_PERIOD,
+) -> Optional[int]:
+    """
+    CPU quota imposed by the container cgroup, rounded up to whole CPUs.
+
+    Returns None when no quota is set or the files are unavailable (bare
+    metal, non-Linux).
+    """
+    try:
+        with open(cpu_max, encoding="ascii") as fh:
+            quota, period = fh.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open(v1_quota, encoding="ascii") as fh:
+                quota = fh.read().strip()
+            with open(v1_period, encoding="ascii") as fh:
+                period = fh.read().strip()
+        except OSError:
+            return None
+    try:
+        quota_us, period_us = int(quota), int(period)
+    except ValueError:  # "max" → unlimited
+        return None
+    if quota_us <= 0 or period_us <= 0:  # v1 uses -1 for unlimited
+        return None
+    return max(1, math.ceil(quota_us / period_us))
+
+
+def default_worker_count() -> int:
+    """
+    Worker processes to use when max_workers is not given.
+
+    CPUs this process may run on (affinity mask, else os.cpu_count()),
+    capped by any container CPU quota, minus one core left to the main
+    process for page reading and result aggregation. OMP_THREAD_LIMIT=1
+    keeps each worker's Tesseract on one core, so workers map 1:1 to CPUs.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_limit()
+    if quota is not None:
+        cpus = min(cpus, quota)
+    return max(1, cpus - 1)
+
+
+def _worker_cv_threads(value: Optional[str]) -> int:
+    """OpenCV thread count for a worker process: 1 unless overridden."""
+    try:
+        return max(0, int(value)) if value else 1
+    except ValueError:
+        return 1
+
+
+def _init_worker(page_processor: Any) -> None:
+    """
+    Worker initializer: runs once per child process.
+
+    Receives the PageProcessor a single time (instead of once per submitted
+    page), warms the heavy imports so the first page pays no import cost,
+    and caps OpenCV's internal threads (GLYPHAR_CV_THREADS, default 1).
+    """
+    global _WORKER_PAGE_PROCESSOR  # pylint: disable=global-statement
+    import cv2  # pylint: disable=import-outside-toplevel
+
+    cv2.setNumThreads(  # pylint: disable=no-member
+        _worker_cv_threads(os.environ.get(_CV_THREADS_ENV))
+    )
+    _WORKER_PAGE_PROCESSOR = page_processor
+
+
+def _process_page_worker(task_data: Dict) -> Dict:
+    """
+    Worker function executed in child process.
+
+    Args:
+        task_data: Dict with keys:
+            - idx: 0-based page index
+            - shm_name: SharedMemory block holding the page pixels
+            - shape, dtype: Array layout of the page image
+            - doc_prefix: Document prefix for canonical IDs
+            - doc_date: Date string for canonical IDs (YYYYMMDD)
+
+    Returns:
+        Dict with keys:
+            - success: bool
+            - page_number: 1-based page number
+            - result: PageResult or None
+            - error: str or None
+    """
+    page_idx = task_data["idx"]
+    shm = SharedMemory(name=task_data["shm_name"])
+    try:
+        # Zero-copy view over the parent's page buffer
+        image_data = np.ndarray(
+            task_data["shape"], dtype=task_data["dtype"], buffer=shm.buf
+        )
+        result = _WORKER_PAGE_PROCESSOR.process(
+            image_data,
+            page_idx + 1,
+            task_data["doc_prefix"],
+            task_data["doc_date"],
+        )
+        return {
+            "success": True,
+            "page_number": result.page_number,
+            "result": result,
+            "error": None,
+        }
+    except ValueError as e:
+        return {
+            "success": False,
+            "page_number": page_idx + 1,
+            "result": None,
+            "error": str(e),
+        }
+    finally:
+        image_data = None
+        try:
+            shm.close()
+        except BufferError:
+            # A view is still referenced (e.g. a detector cache); the mapping
+            # is released with the worker. The parent owns unlink().
+            pass
+
+
+def _share_image(image: np.ndarray) -> SharedMemory:
+    """Copy one page into a new shared-memory block (single memcpy)."""
+    shm = SharedMemory(create=True, size=max(1, image.nbytes))
+    np.ndarray(image.shape, dtype=image.dtype, buffer=shm.buf)[...] = image
+    return shm
+
+
+def _release_shared(shm: SharedMemory) -> None:
+    """Close and unlink a parent-owned shared-memory block."""
+    shm.close()
+    shm.unlink()
+
 
 class ParallelProcessor:
     """
@@ -44,9 +206,9 @@ class ParallelProcessor:
             3. Spawns worker processes
             4. Collects and sorts results
 
-        Worker processes (N = max_workers):
-            1. Deserialize task data
-            2. Instantiate PageProcessor (pickleable)
+        Worker processes (N = max_workers, spawned once and kept alive):
+            1. Receive PageProcessor once via pool initializer
+            2. Deserialize task data
             3. Process single page
             4. Return result to main process
 
@@ -57,59 +219,66 @@ class ParallelProcessor:
 
     Limitations:
         - PageProcessor must be pickleable (no closures, lambdas)
-        - Higher startup latency (~2s process spawn overhead)
+        - Higher startup latency (~2s process spawn overhead, paid once per
+          ParallelProcessor thanks to the persistent pool; call close() or
+          use as a context manager to release workers)
         - Not suitable for I/O-bound workloads (use ThreadPool instead)
     """
 
-    def __init__(self, file_reader, page_processor, max_workers: int = 4):
+    def __init__(self, file_reader, page_processor, max_workers: Optional[int] = None):
         """
         Initialize parallel processor.
 
         Args:
             file_reader: FileReader for initial page extraction (runs in main process).
             page_processor: Pickleable PageProcessor instance (cloned to workers).
-            max_workers: Number of worker processes to spawn.
+            max_workers: Number of worker processes to spawn. None sizes
+                the pool to the host (see default_worker_count()).
 
         Note:
-            page_processor is pickled and sent to each worker process — ensure
-            it contains no unpickleable state (open files, lambdas, etc.).
+            page_processor is pickled once per worker process when the pool
+            starts — ensure it contains no unpickleable state (open files,
+            lambdas, etc.). Later reassignment does not reach live workers.
         """
         self.file_reader = file_reader
         self.page_processor = page_processor
-        self.max_workers = max_workers
-
-    def _process_page_worker(self, task_data: Dict) -> Dict:
-        """
-        Worker function executed in child process.
-
-        Args:
-            task_data: Dict with keys:
-                - idx: 0-based page index
-                - image: Page image (numpy array)
-
-        Returns:
-            Dict with keys:
-                - success: bool
-                - page_number: 1-based page number
-                - result: PageResult or None
-                - error: str or None
-        """
-        page_idx, image_data = task_data["idx"], task_data["image"]
-        try:
-            result = self.page_processor.process(image_data, page_idx + 1)
-            return {
-                "success": True,
-                "page_number": result.page_number,
-                "result": result,
-                "error": None,
-            }
-        except ValueError as e:
-            return {
-                "success": False,
-                "page_number": page_idx + 1,
-                "result": None,
-                "error": str(e),
-            }
+        self.max_workers = (
+            max_workers if max_workers is not None else default_worker_count()
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the persistent worker pool, spawning it on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.page_processor,),
+            )
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        """Abandon a broken pool without waiting on its dead workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def close(self) -> None:
+        """Shut down the worker pool (idempotent)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ParallelProcessor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     def process_parallel(self, file_path: str, _dpi: int = 300) -> Dict[str, Any]:
         """
@@ -137,6 +306,8 @@ class ParallelProcessor:
 
         Error handling:
             - Per-page failures isolated (don't abort entire job)
+            - A dead worker (BrokenProcessPool) propagates; the pool is
+              discarded and rebuilt on the next call
             - 120s timeout per page (prevents hung workers)
             - Failed pages excluded from final results list
 
@@ -155,16 +326,43 @@ class ParallelProcessor:
 
         print(f"⚡ Processando {total_pages} páginas com {self.max_workers} workers...")
 
-        # Stage 2: Prepare tasks
-        tasks = [{"idx": i, "image": img} for i, img in enumerate(all_images)]
-
-        # Stage 3: Parallel processing
+        # Stage 2: Prepare tasks (canonical ID context mirrors FileProcessor).
+        # Each page is written once into shared memory; tasks carry only the
+        # block name and array layout, so submissions don't pickle pixels.
+        doc_prefix = path.stem.replace(" ", "_").lower()
+        doc_date = datetime.fromtimestamp(path.stat().st_mtime).strftime("%Y%m%d")
+        segments: Dict[int, SharedMemory] = {}
+        page_nbytes: Dict[int, int] = {}
+        tasks = []
+        for i, img in enumerate(all_images):
+            img = np.asarray(img)
+            segments[i] = _share_image(img)
+            page_nbytes[i] = img.nbytes
+            tasks.append(
+                {
+                    "idx": i,
+                    "shm_name": segments[i].name,
+                    "shape": img.shape,
+                    "dtype": img.dtype.str,
+                    "doc_prefix": doc_prefix,
+                    "doc_date": doc_date,
+                }
+            )
+        del all_images
+
+        # Largest pages first (LPT scheduling): a big trailing page would
+        # otherwise start last and hold the whole batch open. Stable sort,
+        # so equal-sized pages keep document order; stage 4 re-sorts by idx.
+        tasks.sort(key=lambda task: -page_nbytes[task["idx"]])
+
+        # Stage 3: Parallel processing on the persistent pool
         results_by_page = {}
 
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+        try:
+            executor = self._get_executor()
             # Submit all tasks
             future_to_page = {
-                executor.submit(self._process_page_worker, task): task["idx"]
+                executor.submit(_process_page_worker, task): task["idx"]
                 for task in tasks
             }
 
@@ -190,6 +388,17 @@ class ParallelProcessor:
                         "error": str(e),
                     }
 
+                # Worker is done with this page: free its shared block now
+                _release_shared(segments.pop(page_idx))
+        except BrokenExecutor:
+            # A worker died (crash, OOM kill): the pool is unusable. Drop it
+            # so the next call spawns a fresh one instead of failing at once.
+            self._discard_executor()
+            raise
+        finally:
+            for shm in segments.values():
+                _release_shared(shm)
+
         # Stage 4: Aggregate results
         sorted_results = [
             results_by_page[i]["result"]
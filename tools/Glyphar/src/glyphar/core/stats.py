@@ -5,7 +5,10 @@ Pure functions that aggregate page-level metrics into document-level summaries.
 No side effects — inputs in, statistics out.
 """
 
+from typing import Sequence
+
 import numpy as np
+import numpy.typing as npt
 from glyphar.models.page import PageResult
 from glyphar.models.stats import ProcessingStatistics
 
@@ -23,7 +26,7 @@ def page_word_count(page: PageResult) -> int:
     Note:
         Handles empty pages/fallback pages gracefully (returns 0).
     """
-    return sum(getattr(col, "word_count", 0) for col in getattr(page, "columns", []))
+    return page.total_words
 
 
 def page_char_count(page: PageResult) -> int:
@@ -36,13 +39,13 @@ def page_char_count(page: PageResult) -> int:
     Returns:
         Sum of character counts across all columns.
     """
-    return sum(getattr(col, "char_count", 0) for col in getattr(page, "columns", []))
+    return page.total_chars
 
 
 def calculate_statistics(
     *,
     pages_results: list[PageResult],
-    confidences: list[float],
+    confidences: Sequence[float] | npt.NDArray[np.float64],
     quality_distribution: dict,
     _start_time: float,
     elapsed: float,
@@ -53,7 +56,8 @@ def calculate_statistics(
 
     Args:
         pages_results: List of PageResult instances.
-        confidences: List of page confidence scores (parallel to pages_results).
+        confidences: Page confidence scores (parallel to pages_results), as a
+            list or float64 array.
         quality_distribution: Histogram of page quality categories (optional).
         start_time: Processing start timestamp (for duration calculation).
         min_confidence: Threshold for successful page classification.
@@ -74,18 +78,26 @@ def calculate_statistics(
         Caller must set total_processing_time_s and pages_per_second after
         receiving this object (requires end timestamp not available here).
     """
-    total_words = sum(page_word_count(p) for p in pages_results)
-    total_chars = sum(page_char_count(p) for p in pages_results)
-    avg_conf = float(np.mean(confidences)) if confidences else 0.0
-
-    successful = sum(
-        1 for p in pages_results if p.page_confidence_mean > min_confidence
-    )
+    # Single traversal of the page/column object graph: every metric is
+    # accumulated in the same pass instead of walking pages_results per metric.
+    total_words = total_chars = successful = 0
+    low_conf_pages = []
+    for p in pages_results:
+        total_words += p.total_words
+        total_chars += p.total_chars
+        conf = p.page_confidence_mean
+        if conf > min_confidence:
+            successful += 1
+        if conf < 60.0:
+            low_conf_pages.append(p.page_number)
     failed = len(pages_results) - successful
 
-    low_conf_pages = [
-        p.page_number for p in pages_results if p.page_confidence_mean < 60.0
-    ]
+    # Reduce the caller's float64 array in place; average plain lists with
+    # builtins rather than building an ndarray just for the mean.
+    if isinstance(confidences, np.ndarray):
+        avg_conf = float(confidences.mean()) if confidences.size else 0.0
+    else:
+        avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
 
     pages_per_second = len(pages_results) / elapsed if elapsed > 0 else 0.0
 
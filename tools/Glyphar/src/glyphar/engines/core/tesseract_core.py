@@ -33,7 +33,9 @@ This module represents the pure OCR execution layer.
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+import shlex
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 
 import numpy as np
 import numpy.typing as npt
@@ -59,6 +61,10 @@ class TesseractCoreEngine(OCREngine):
     languages : str, optional
         Language codes passed to Tesseract (e.g. "por+eng").
         Defaults to "por+eng".
+    tessdata_dir : Path or str, optional
+        Model directory passed as ``--tessdata-dir`` on every call. When
+        omitted, Tesseract resolves models itself (TESSDATA_PREFIX or its
+        compiled-in default).
 
     Notes
     -----
@@ -66,8 +72,18 @@ class TesseractCoreEngine(OCREngine):
     This guarantees compatibility with OpenCV and Tesseract expectations.
     """
 
-    def __init__(self, languages: str = "por+eng") -> None:
+    def __init__(
+        self,
+        languages: str = "por+eng",
+        tessdata_dir: Optional[Path | str] = None,
+    ) -> None:
         self.languages = languages
+        # Quoted once: pytesseract shlex-splits the config string
+        self._tessdata_arg = (
+            f"--tessdata-dir {shlex.quote(str(tessdata_dir))}"
+            if tessdata_dir is not None
+            else None
+        )
 
     def recognize(self, image: UInt8Image, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -135,6 +151,8 @@ class TesseractCoreEngine(OCREngine):
         # --- Build Tesseract CLI config string --------------------------------
 
         tess_config_parts: List[str] = [f"--psm {psm}"]
+        if self._tessdata_arg is not None:
+            tess_config_parts.append(self._tessdata_arg)
         if isinstance(oem, int):
             tess_config_parts.append(f"--oem {oem}")
 
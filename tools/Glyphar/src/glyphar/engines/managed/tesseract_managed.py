@@ -8,18 +8,23 @@ from __future__ import annotations
 
 import hashlib
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
 from glyphar.engines.base import OCREngine
+from glyphar.engines.cached_result import CachedResult
 from glyphar.engines.config_builder import TesseractConfigBuilder
 from glyphar.engines.core.tesseract_core import TesseractCoreEngine
 from glyphar.engines.fallback import apply_fallback_strategy
 from glyphar.engines.optimizer import optimize_ocr_config
+from glyphar.engines.persistent_cache import PersistentOCRCache
 from glyphar.engines.stats import OCRStats
 from glyphar.engines.user_files import UserFilesManager
 from glyphar.engines.validation import validate_tessdata
@@ -28,6 +33,9 @@ from glyphar.models.enums import PageQuality
 
 UInt8Image = npt.NDArray[np.uint8]
 
+# Upper bound on remembered fallback results (see _failures below).
+_FAILURE_CACHE_SIZE = 128
+
 
 class TesseractManagedEngine(OCREngine):
     """
@@ -41,21 +49,52 @@ class TesseractManagedEngine(OCREngine):
         languages: str = "por+eng",
         model_type: str = "fast",
         config: Optional[OCRConfig] = None,
+        sampled_cache_key: bool = False,
+        cache_size: int = 1000,
+        persistent_cache: Optional[str | Path | PersistentOCRCache] = None,
+        failure_ttl_s: float = 300.0,
     ) -> None:
         self.tessdata_dir = Path(tessdata_dir)
         self.languages = validate_tessdata(self.tessdata_dir, languages)
         self.model_type = model_type
         self.config = config or OCRConfig()
 
-        # Set TESSDATA_PREFIX for any lower-level call that needs it.
-        os.environ["TESSDATA_PREFIX"] = str(self.tessdata_dir)
-
         self.builder = TesseractConfigBuilder(self.tessdata_dir, model_type)
-        self.user_files = UserFilesManager(model_type)
+        self.user_files = UserFilesManager.shared(model_type)
+        # Static dictionaries: written once per process, not per recognize()
+        self.user_files.prepare()
         self.stats = OCRStats()
-        self.cache: Dict[str, Dict[str, Any]] = {}
-
-        self.core = TesseractCoreEngine(self.languages)
+        # LRU of recognize() results, packed (see cached_result); shared by
+        # the region/page threads, so every access goes through _cache_lock.
+        self.cache_size = max(0, int(cache_size))
+        self.cache: OrderedDict[str, CachedResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Results produced after the primary run failed (degraded fallback
+        # text, or a failure of every fallback), kept only for failure_ttl_s
+        # so a transient failure (timeout on an overloaded host, killed
+        # subprocess) is retried later instead of sticking forever. Never
+        # stored in the LRU or persisted to disk.
+        self.failure_ttl_s = float(failure_ttl_s)
+        self._failures: OrderedDict[str, Tuple[float, CachedResult]] = (
+            OrderedDict()
+        )
+        # Opt-in: key the cache on a ~64 KB strided sample instead of every
+        # pixel (see _compute_cache_key for the collision trade-off).
+        self.sampled_cache_key = sampled_cache_key
+        # Optional on-disk layer behind the LRU: results survive restarts
+        # and are shared with other processes using the same file.
+        if persistent_cache is not None and not isinstance(
+            persistent_cache, PersistentOCRCache
+        ):
+            persistent_cache = PersistentOCRCache(persistent_cache)
+        self.persistent_cache: Optional[PersistentOCRCache] = persistent_cache
+
+        # Models are located via an explicit --tessdata-dir per call rather
+        # than a process-wide TESSDATA_PREFIX, so engines with different
+        # tessdata directories can coexist in one process.
+        self.core = TesseractCoreEngine(
+            self.languages, tessdata_dir=self.tessdata_dir.resolve()
+        )
 
     def recognize(self, image: UInt8Image, config: Dict[str, Any]) -> Dict[str, Any]:
         start_time = time.perf_counter()
@@ -68,16 +107,31 @@ class TesseractManagedEngine(OCREngine):
         min_confidence = float(config.get("min_confidence", 0.0))
 
         optimized_config = optimize_ocr_config(psm, quality_hint, self.model_type)
-        self.user_files.prepare()
 
         cache_key = self._compute_cache_key(
             image=image,
             optimized_config=optimized_config,
             min_confidence=min_confidence,
         )
-        if cache_key in self.cache:
+        with self._cache_lock:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.cache.move_to_end(cache_key)
+            elif cache_key in self._failures:
+                expires_at, failure = self._failures[cache_key]
+                if time.monotonic() < expires_at:
+                    cached = failure
+                else:
+                    del self._failures[cache_key]
+        if cached is not None:
             self.stats.record_cache_hit()
-            return dict(self.cache[cache_key])
+            return cached.to_dict()
+        if self.persistent_cache is not None:
+            stored = self.persistent_cache.get(cache_key)
+            if stored is not None:
+                self._remember(cache_key, CachedResult.from_dict(stored))
+                self.stats.record_cache_hit()
+                return stored
 
         self.stats.record_cache_miss()
 
@@ -110,17 +164,97 @@ class TesseractManagedEngine(OCREngine):
                 timeout=int(optimized_config.get("timeout", 10)),
             )
             result["config_used"] = config_used
+            result["from_fallback"] = True
+            self.stats.record_fallback()
 
         result["processing_time_ms"] = (time.perf_counter() - start_time) * 1000
         self.stats.update(
             float(result.get("confidence", 0.0)), result["processing_time_ms"]
         )
 
-        if len(self.cache) < 1000:
-            self.cache[cache_key] = dict(result)
+        if result.get("from_fallback"):
+            # Up to three timed-out Tesseract runs per hit otherwise.
+            with self._cache_lock:
+                self._failures[cache_key] = (
+                    time.monotonic() + self.failure_ttl_s,
+                    CachedResult.from_dict(result),
+                )
+                self._failures.move_to_end(cache_key)
+                if len(self._failures) > _FAILURE_CACHE_SIZE:
+                    self._failures.popitem(last=False)
+            return result
+
+        self._remember(cache_key, CachedResult.from_dict(result))
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(cache_key, result)
 
         return result
 
+    def recognize_batch(
+        self,
+        images: Sequence[UInt8Image],
+        configs: Mapping[str, Any] | Sequence[Dict[str, Any]] | None = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Recognize several independent images concurrently.
+
+        Each Tesseract call is a subprocess, so threads overlap the OCR
+        itself; only the thin Python bookkeeping (hashing, cache lookups,
+        post-processing) shares the GIL. The cache, stats and user files
+        are already safe to share across threads.
+
+        Args:
+            images: Images to recognize.
+            configs: One config applied to every image, or one per image.
+            max_workers: Threads to use. None uses one per CPU (capped by
+                the number of images).
+
+        Returns:
+            Results in the same order as images.
+        """
+        if configs is None or isinstance(configs, Mapping):
+            page_configs = [dict(configs or {})] * len(images)
+        else:
+            page_configs = list(configs)
+            if len(page_configs) != len(images):
+                raise ValueError(
+                    f"expected {len(images)} configs, got {len(page_configs)}"
+                )
+
+        workers = min(len(images), max_workers or os.cpu_count() or 1)
+        if workers <= 1:
+            return [
+                self.recognize(image, config)
+                for image, config in zip(images, page_configs)
+            ]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ocr-batch"
+        ) as executor:
+            return list(executor.map(self.recognize, images, page_configs))
+
+    def _remember(self, cache_key: str, result: CachedResult) -> None:
+        """Insert into the in-process LRU, evicting the oldest entry if full."""
+        if self.cache_size:
+            with self._cache_lock:
+                self.cache[cache_key] = result
+                self.cache.move_to_end(cache_key)
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks don't pickle (ProcessPool workers); each copy starts with its
+        # own empty cache.
+        state = self.__dict__.copy()
+        state["cache"] = OrderedDict()
+        state["_failures"] = OrderedDict()
+        del state["_cache_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
     @staticmethod
     def _normalize_quality(value: Any) -> PageQuality:
         if isinstance(value, PageQuality):
@@ -138,8 +272,13 @@ class TesseractManagedEngine(OCREngine):
     ) -> Dict[str, Any]:
         words_in = core_result.get("words", []) or []
         kept_words = []
-        confidences = []
         text_parts = []
+        # Single pass: running sum/min/max instead of a confidences list
+        # reduced three more times (np.mean is all dispatch cost at this size).
+        n_conf = 0
+        sum_conf = 0.0
+        min_conf = float("inf")
+        max_conf = float("-inf")
 
         for item in words_in:
             text = str(item.get("text", "")).strip()
@@ -163,10 +302,16 @@ class TesseractManagedEngine(OCREngine):
             )
             text_parts.append(text)
             if conf >= 0:
-                confidences.append(conf)
+                n_conf += 1
+                sum_conf += conf
+                if conf < min_conf:
+                    min_conf = conf
+                if conf > max_conf:
+                    max_conf = conf
 
-        full_text = " ".join(text_parts).strip()
-        avg_conf = float(np.mean(confidences)) if confidences else 0.0
+        # Parts are stripped and non-empty, so the join needs no strip().
+        full_text = " ".join(text_parts)
+        avg_conf = sum_conf / n_conf if n_conf else 0.0
 
         return {
             "text": full_text,
@@ -175,8 +320,8 @@ class TesseractManagedEngine(OCREngine):
             "word_count": len(kept_words),
             "char_count": len(full_text),
             "avg_word_confidence": avg_conf,
-            "min_word_confidence": min(confidences) if confidences else 0.0,
-            "max_word_confidence": max(confidences) if confidences else 0.0,
+            "min_word_confidence": min_conf if n_conf else 0.0,
+            "max_word_confidence": max_conf if n_conf else 0.0,
         }
 
     def _compute_cache_key(
@@ -185,10 +330,30 @@ class TesseractManagedEngine(OCREngine):
         optimized_config: Dict[str, Any],
         min_confidence: float,
     ) -> str:
-        image_hash = hashlib.md5(image.tobytes()).hexdigest()[:16]
+        # SHA-256 rather than MD5: OpenSSL runs it on the SHA-NI/ARMv8 crypto
+        # extensions, ~2x MD5 throughput on a full page (blake2b/blake3 are
+        # slower here or need an extra dependency). The full 256-bit digest
+        # is kept: keys may be persisted and outlive any one process.
+        # hashlib reads the array buffer in place; only strided views (which
+        # the buffer protocol rejects) are copied first.
+        shape = image.shape
+        if self.sampled_cache_key:
+            # ~256x256 grid (~64 KB) regardless of page size: O(1) probes,
+            # but pages differing only between grid points share a key (a
+            # single changed digit in a text line is enough), so the
+            # exact full-buffer hash stays the default.
+            step_y = max(1, shape[0] // 256)
+            step_x = max(1, shape[1] // 256)
+            image = np.ascontiguousarray(image[::step_y, ::step_x])
+        elif not image.flags["C_CONTIGUOUS"]:
+            image = np.ascontiguousarray(image)
+        # Not a security use: usedforsecurity=False keeps the key working on
+        # FIPS-restricted OpenSSL builds.
+        image_hash = hashlib.sha256(image, usedforsecurity=False).hexdigest()
         return "|".join(
             [
                 image_hash,
+                f"shape={shape}",
                 self.languages,
                 self.model_type,
                 f"psm={optimized_config['psm']}",
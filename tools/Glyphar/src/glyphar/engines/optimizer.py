@@ -13,6 +13,7 @@ Design principles:
     - Separation of base profile vs. quality overrides
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from glyphar.models.enums import PageQuality
@@ -74,8 +75,22 @@ def optimize_ocr_config(
             'timeout': 60,
             'extra': '-c textord_min_linesize=1.5'
         }
+
+    Note:
+        Results are memoized per (psm, quality, model_type) — a handful of
+        combinations per document; each call returns a fresh dict copy, so
+        callers may still mutate what they get.
     """
+    return dict(_optimize_ocr_config(psm, quality, model_type))
+
 
+@lru_cache(maxsize=64)
+def _optimize_ocr_config(
+    psm: Optional[int],
+    quality: PageQuality,
+    model_type: str,
+) -> Dict[str, Any]:
+    """Uncached body of optimize_ocr_config (never hand this dict out)."""
     base_profiles = {
         "fast": {"oem": 1, "timeout": 15},
         "standard": {"oem": 2, "timeout": 30},
@@ -0,0 +1,147 @@
+"""
+On-disk OCR result cache that survives process restarts.
+
+Re-running a batch over the same corpus otherwise pays the full OCR cost
+(50-250 ms per region) again for every page. This cache stores recognize()
+results in a single SQLite file so later runs, and other processes on the
+same host, can reuse them.
+
+Design constraints:
+    - Standard library only (sqlite3 + json; no diskcache/msgpack dependency)
+    - Safe across threads (one connection behind a lock) and processes
+      (SQLite WAL locking); picklable, reconnecting lazily after unpickling
+    - Bounded: least-recently-read entries are evicted past max_bytes
+    - Values are JSON (str/int/float/bool/None, lists, dicts) — exactly the
+      OCREngine result contract
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ocr_results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ocr_results_accessed ON ocr_results (accessed);
+"""
+
+
+class PersistentOCRCache:
+    """
+    SQLite-backed key → OCR result store with an LRU size bound.
+
+    Example:
+        >>> cache = PersistentOCRCache("~/.cache/glyphar/ocr.sqlite")
+        >>> cache.set(key, result)
+        >>> cache.get(key) == result
+        True
+    """
+
+    def __init__(self, path: str | Path, max_bytes: int = 2 * 1024**3) -> None:
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite file path; parent directories are created.
+            max_bytes: Budget for stored values (JSON bytes); oldest-read
+                entries are evicted once it is exceeded.
+        """
+        self.path = Path(path).expanduser()
+        self.max_bytes = int(max_bytes)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._bytes = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection on first use (call with _lock held)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path), timeout=30.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            # Running total; other processes may drift it, which only shifts
+            # when eviction kicks in.
+            self._bytes = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM ocr_results"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for key (refreshing its recency), or None."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value FROM ocr_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with conn:
+                conn.execute(
+                    "UPDATE ocr_results SET accessed = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key, evicting least-recently-read entries if needed."""
+        blob = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        size = len(blob.encode("utf-8"))
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                old = conn.execute(
+                    "SELECT size FROM ocr_results WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO ocr_results VALUES (?, ?, ?, ?)",
+                    (key, blob, size, time.time()),
+                )
+                self._bytes += size - (old[0] if old else 0)
+                if self._bytes > self.max_bytes:
+                    self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop oldest-read entries down to 90% of max_bytes (inside a transaction)."""
+        target = int(self.max_bytes * 0.9)
+        doomed = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM ocr_results ORDER BY accessed"
+        ):
+            if self._bytes <= target:
+                break
+            doomed.append((key,))
+            self._bytes -= size
+        conn.executemany("DELETE FROM ocr_results WHERE key = ?", doomed)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM ocr_results"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection (reopened automatically on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Connections and locks don't pickle; workers reconnect on first use.
+        return {"path": self.path, "max_bytes": self.max_bytes}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["path"], state["max_bytes"])
@@ -8,9 +8,12 @@ It is intentionally:
     - Non-intrusive
     - Incremental (no history storage)
     - Suitable for real-time decision making (fallback, optimization)
+    - Thread-safe (one engine is shared by region threads and
+      recognize_batch workers)
 """
 
-from typing import Dict
+import threading
+from typing import Any, Dict
 
 
 class OCRStats:
@@ -25,6 +28,7 @@ class OCRStats:
         - Minimum and maximum confidence observed
         - Low-confidence page count (threshold-based)
         - Cache hit/miss ratio
+        - Pages recovered (or abandoned) by the fallback ladder
 
     Design rationale:
         - O(1) updates (no historical storage)
@@ -47,6 +51,8 @@ class OCRStats:
         self.low_confidence_pages = 0
         self.cache_hits = 0
         self.cache_misses = 0
+        self.fallback_pages = 0
+        self._lock = threading.Lock()
 
     def update(self, confidence: float, time_ms: float) -> None:
         """
@@ -56,28 +62,47 @@ class OCRStats:
             confidence: Page confidence score (0.0–100.0).
             time_ms: Processing time for the page in milliseconds.
         """
-        new_total = self.total_pages + 1
-
-        self.avg_confidence = (
-            (self.avg_confidence * self.total_pages) + confidence
-        ) / new_total
-
-        self.total_pages = new_total
-        self.total_time_ms += time_ms
-
-        self.min_confidence = min(self.min_confidence, confidence)
-        self.max_confidence = max(self.max_confidence, confidence)
-
-        if confidence < 50.0:
-            self.low_confidence_pages += 1
+        with self._lock:
+            # Welford running mean: no avg * n rescaling, so rounding error
+            # does not accumulate with the page count.
+            self.total_pages += 1
+            self.avg_confidence += (
+                confidence - self.avg_confidence
+            ) / self.total_pages
+            self.total_time_ms += time_ms
+
+            if confidence < self.min_confidence:
+                self.min_confidence = confidence
+            if confidence > self.max_confidence:
+                self.max_confidence = confidence
+
+            if confidence < 50.0:
+                self.low_confidence_pages += 1
 
     def record_cache_hit(self) -> None:
         """Register a cache hit event."""
-        self.cache_hits += 1
+        with self._lock:
+            self.cache_hits += 1
 
     def record_cache_miss(self) -> None:
         """Register a cache miss event."""
-        self.cache_misses += 1
+        with self._lock:
+            self.cache_misses += 1
+
+    def record_fallback(self) -> None:
+        """Register a page that went through the fallback strategy."""
+        with self._lock:
+            self.fallback_pages += 1
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks don't pickle (engines are shipped to worker processes)
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def get_summary(self) -> Dict[str, float]:
         """
@@ -93,6 +118,7 @@ class OCRStats:
                 - total_time_ms
                 - avg_time_per_page_ms
                 - cache_hit_ratio
+                - fallback_pages
         """
         total_cache_ops = self.cache_hits + self.cache_misses
 
@@ -109,4 +135,5 @@ class OCRStats:
             "cache_hit_ratio": (
                 self.cache_hits / total_cache_ops if total_cache_ops > 0 else 0.0
             ),
+            "fallback_pages": self.fallback_pages,
         }
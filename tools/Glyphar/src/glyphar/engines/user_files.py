@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import atexit
 import os
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional
 
 
 class UserFilesManager:
@@ -22,6 +23,10 @@ class UserFilesManager:
         - Small curated list (14 terms) vs large generic dictionaries
         - Portuguese-focused vs multi-language support
 
+    Engines should use UserFilesManager.shared(model_type): every engine
+    writes the same fixed paths, so one manager per model type means one set
+    of writes and one atexit hook per process, however many engines exist.
+
     Example:
         >>> manager = UserFilesManager("fast")
         >>> manager.prepare()  # Creates /tmp/tesseract_user_words.txt
@@ -52,11 +57,24 @@ class UserFilesManager:
         r"p\. \d+",  # Page references (p. 123)
     ]
 
+    # File bodies, serialized once at class creation (one write per prepare)
+    _WORDS_BLOB: ClassVar[bytes] = (
+        "\n".join(PSYCHOANALYTIC_TERMS) + "\n"
+    ).encode("utf-8")
+    _PATTERNS_BLOB: ClassVar[bytes] = (
+        "\n".join(CITATION_PATTERNS) + "\n"
+    ).encode("utf-8")
+
     SUPPORTED_MODEL_TYPES = {"fast", "standard", "best"}
 
     DEFAULT_WORDS_PATH = Path("/tmp/tesseract_user_words.txt")
     DEFAULT_PATTERNS_PATH = Path("/tmp/tesseract_user_patterns.txt")
 
+    # Process-wide managers by model type (see shared()). Class attributes,
+    # so the lock never travels with a pickled instance.
+    _shared: ClassVar[Dict[str, "UserFilesManager"]] = {}
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, model_type: str):
         """
         Initialize manager for given model type.
@@ -77,6 +95,20 @@ class UserFilesManager:
         self._cleanup_registered = False
         self._register_cleanup()
 
+    @classmethod
+    def shared(cls, model_type: str) -> "UserFilesManager":
+        """
+        Return the process-wide manager for model_type, creating it once.
+
+        Raises:
+            ValueError: If model_type is unsupported.
+        """
+        with cls._shared_lock:
+            manager = cls._shared.get(model_type)
+            if manager is None:
+                manager = cls._shared[model_type] = cls(model_type)
+            return manager
+
     def prepare(self) -> None:
         """
         Create temporary dictionary files for Tesseract consumption.
@@ -88,18 +120,20 @@ class UserFilesManager:
         Note:
             Files persist until explicit cleanup() or process termination.
             Tesseract must be configured with --user-words/--user-patterns to use them.
+            Safe to call concurrently on a shared manager (writes happen once).
         """
-        if not self.words_file:
-            self.words_file = self._write_to_file(
-                self.DEFAULT_WORDS_PATH,
-                self.PSYCHOANALYTIC_TERMS,
-            )
-
-        if self.model_type == "best" and not self.patterns_file:
-            self.patterns_file = self._write_to_file(
-                self.DEFAULT_PATTERNS_PATH,
-                self.CITATION_PATTERNS,
-            )
+        with self._shared_lock:
+            if not self.words_file:
+                self.words_file = self._write_to_file(
+                    self.DEFAULT_WORDS_PATH,
+                    self._WORDS_BLOB,
+                )
+
+            if self.model_type == "best" and not self.patterns_file:
+                self.patterns_file = self._write_to_file(
+                    self.DEFAULT_PATTERNS_PATH,
+                    self._PATTERNS_BLOB,
+                )
 
     def cleanup(self) -> None:
         """Remove temporary dictionary files."""
@@ -134,8 +168,8 @@ class UserFilesManager:
             self._cleanup_registered = False
 
     @staticmethod
-    def _write_to_file(path: Path, lines: List[str]) -> str:
-        """Write lines to a path and return the resulting file path as string."""
+    def _write_to_file(path: Path, blob: bytes) -> str:
+        """Write a pre-encoded file body and return the file path as string."""
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("\n".join(lines), encoding="utf-8")
+        path.write_bytes(blob)
         return str(path)
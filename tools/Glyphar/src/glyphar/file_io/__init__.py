@@ -13,6 +13,9 @@ Public API:
         - PDFReader: Multi-page PDF support via pdf2image
         - ImageReader: Single-page raster images (PNG/JPG/TIFF)
 
+    Caching:
+        - RasterCache: On-disk store of rendered pages (PDFReader(cache=...))
+
     Usage:
         >>> from file_io import PDFReader
         >>> reader = PDFReader(dpi=200)
@@ -21,6 +24,7 @@ Public API:
 """
 
 from .base import FileReader, FileWriter
+from .raster_cache import RasterCache
 from .readers import PDFReader, ImageReader
 
 __all__ = [
@@ -28,4 +32,5 @@ __all__ = [
     "FileWriter",
     "PDFReader",
     "ImageReader",
+    "RasterCache",
 ]
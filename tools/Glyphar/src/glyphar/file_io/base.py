@@ -13,7 +13,7 @@ Design rationale:
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Iterator, List
 
 
 class FileReader(ABC):
@@ -56,6 +56,16 @@ class FileReader(ABC):
             (dtype=uint8, channels=3 for color or 1 for grayscale).
         """
 
+    def read_iter(self, path: Path) -> Iterator[Any]:
+        """
+        Yield page images one at a time, in page order.
+
+        Readers that can decode incrementally (e.g. PDFReader) override this
+        to keep only a few pages in memory; the default reads everything.
+        Same errors as read().
+        """
+        return iter(self.read(path))
+
 
 class FileWriter(ABC):
     """
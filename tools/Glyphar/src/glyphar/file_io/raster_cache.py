@@ -0,0 +1,115 @@
+"""
+On-disk cache of rasterized document pages.
+
+Rendering is the most expensive read stage (~1.2s/page at 300 DPI), and the
+same PDF is often processed repeatedly (retries, re-OCR with other
+settings). This cache stores each rendered page as a .npy file so repeat
+reads load pixels instead of re-running Poppler.
+
+Design constraints:
+    - Standard library + numpy only (no diskcache/joblib/lz4 dependency)
+    - Keys cover everything that changes the pixels: resolved path, file
+      size and mtime, plus the renderer settings passed by the reader
+    - Entries are written to a temporary directory and renamed into place
+      when the last page is stored, so an interrupted render is never
+      served as a complete document
+    - Bounded: least-recently-used documents are evicted past max_bytes
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+
+class RasterCache:
+    """
+    Directory of rendered documents, one subdirectory of .npy pages each.
+
+    Example:
+        >>> cache = RasterCache("~/.cache/glyphar/pages")
+        >>> reader = PDFReader(dpi=300, cache=cache)
+        >>> pages = reader.read(Path("book.pdf"))  # renders and stores
+        >>> pages = reader.read(Path("book.pdf"))  # loads from cache
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 2 * 1024**3) -> None:
+        """
+        Args:
+            directory: Cache root; created on first store.
+            max_bytes: Budget for stored pages; least-recently-used
+                documents are removed once a store exceeds it.
+        """
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = int(max_bytes)
+
+    def key(self, path: Path, **settings: Any) -> str:
+        """Cache key for a document file rendered with the given settings."""
+        stat = path.stat()
+        parts = [str(path.resolve()), str(stat.st_size), str(stat.st_mtime_ns)]
+        parts += [f"{name}={settings[name]}" for name in sorted(settings)]
+        return hashlib.sha256(
+            "\0".join(parts).encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+    def load(self, key: str) -> Optional[Iterator[np.ndarray]]:
+        """Lazily load a stored document's pages, or None on a miss."""
+        entry = self.directory / key
+        try:
+            names = sorted(p.name for p in entry.iterdir() if p.suffix == ".npy")
+        except FileNotFoundError:
+            return None
+        # Touch for LRU eviction
+        os.utime(entry)
+        return (np.load(entry / name) for name in names)
+
+    def store(self, key: str, pages: Iterable[np.ndarray]) -> Iterator[np.ndarray]:
+        """
+        Pass pages through while writing them under key.
+
+        The entry only becomes visible once the source is exhausted; if
+        iteration stops early, the partial entry is discarded.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key[:16]}-", dir=self.directory))
+        complete = False
+        try:
+            for index, page in enumerate(pages):
+                np.save(staging / f"{index:06d}.npy", page)
+                yield page
+            complete = True
+        finally:
+            if complete:
+                try:
+                    os.replace(staging, self.directory / key)
+                except OSError:
+                    # Another process stored the same document first
+                    complete = False
+            if not complete:
+                shutil.rmtree(staging, ignore_errors=True)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least-recently-used documents until under max_bytes."""
+        entries = []
+        total = 0
+        for entry in self.directory.iterdir():
+            if not entry.is_dir() or entry.name.startswith("."):
+                continue
+            try:
+                size = sum(p.stat().st_size for p in entry.iterdir())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except FileNotFoundError:
+                continue  # evicted concurrently by another process
+            total += size
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -8,7 +8,8 @@ Enables:
     - Result aggregation (BatchResult)
 """
 
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, ConfigDict
 from .config import OCRConfig
@@ -108,17 +109,35 @@ class BatchResult(BaseModel):
     @property
     def completed_tasks(self) -> List[BatchTask]:
         """Tasks with COMPLETED status."""
-        return [t for t in self.tasks if t.status == BatchStatus.COMPLETED]
+        return list(self._tasks_by_status.get(BatchStatus.COMPLETED, ()))
 
     @property
     def failed_tasks(self) -> List[BatchTask]:
         """Tasks with FAILED status."""
-        return [t for t in self.tasks if t.status == BatchStatus.FAILED]
+        return list(self._tasks_by_status.get(BatchStatus.FAILED, ()))
 
     @property
     def success_rate(self) -> float:
         """Percentage of successfully completed tasks."""
-        return len(self.completed_tasks) / self.total_tasks * 100 if self.tasks else 0.0
+        completed = len(self._tasks_by_status.get(BatchStatus.COMPLETED, ()))
+        return completed / self.total_tasks * 100 if self.tasks else 0.0
+
+    # Frozen model (tasks are frozen too): group by status in one pass on
+    # first use instead of rescanning every task per status query.
+    @cached_property
+    def _tasks_by_status(self) -> Dict[str, Tuple[BatchTask, ...]]:
+        groups: Dict[str, List[BatchTask]] = {}
+        for task in self.tasks:
+            groups.setdefault(task.status, []).append(task)
+        return {status: tuple(tasks) for status, tasks in groups.items()}
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "BatchResult":
+        """Copy, dropping the cached status grouping (model_copy copies __dict__)."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_tasks_by_status", None)
+        return copied
 
     @property
     def total_duration_s(self) -> Optional[float]:
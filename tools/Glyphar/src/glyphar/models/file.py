@@ -56,6 +56,13 @@ class FileMetadata(BaseModel):
         None, ge=0, description="Total page count (PDFs/images sequences)"
     )
 
+    clean_sharpness_threshold: Optional[float] = Field(
+        None, description="Calibrated clean-digital sharpness gate (None = default)"
+    )
+    clean_contrast_threshold: Optional[float] = Field(
+        None, description="Calibrated clean-digital contrast gate (None = default)"
+    )
+
     model_config = ConfigDict(
         extra="ignore",
         frozen=True,  # Immutable after creation
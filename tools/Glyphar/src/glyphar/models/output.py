@@ -8,7 +8,8 @@ Designed for seamless integration with:
     - Audit systems (immutable metadata)
 """
 
-from typing import List, Dict, Any, cast
+from functools import cached_property
+from typing import List, Dict, Any, Mapping, Optional, Tuple, cast
 from datetime import datetime, timezone
 from pydantic import BaseModel, Field, ConfigDict
 from .file import FileMetadata
@@ -95,7 +96,22 @@ class OCROutput(BaseModel):
     @property
     def high_quality_pages(self) -> List[PageResult]:
         """Pages with confidence ≥ 90% (minimal LLM correction needed)."""
-        return [p for p in self.pages if p.is_high_quality]
+        # Fresh list per call (callers may mutate it); the scan is cached
+        return list(self._high_quality_pages)
+
+    # Frozen model: the filter is a pure function of pages, so scan once.
+    # A tuple, so the cached value itself cannot be mutated by callers.
+    @cached_property
+    def _high_quality_pages(self) -> Tuple[PageResult, ...]:
+        return tuple(p for p in self.pages if p.is_high_quality)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "OCROutput":
+        """Copy, dropping the cached page scan (model_copy copies __dict__)."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("_high_quality_pages", None)
+        return copied
 
     def llm_ready_text(self) -> str:
         """
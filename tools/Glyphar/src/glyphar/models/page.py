@@ -70,6 +70,8 @@ class PageResult(BaseModel):
         },
     )
 
+    # Plain properties, not cached: model_copy(update=...) copies the
+    # instance __dict__, so a cached total would outlive replaced columns.
     @property
     def total_words(self) -> int:
         """Total words across all columns."""
@@ -98,4 +100,7 @@ class PageResult(BaseModel):
         Note:
             Does not apply post-processing (normalization, spellcheck) — pure OCR output.
         """
-        return separator.join(c.text for c in self.columns if c.text.strip())
+        # isspace() tests for content without strip()'s per-column copy
+        return separator.join(
+            c.text for c in self.columns if c.text and not c.text.isspace()
+        )
@@ -13,8 +13,9 @@ Critical constraint:
 
 from __future__ import annotations
 
+import sys
 import time
-from typing import Any, Dict, Mapping, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Protocol, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -22,6 +23,9 @@ import numpy.typing as npt
 from .config_strategy import ConfigStrategy, EngineConfig
 from .image_preprocessor import ImagePreprocessor
 
+if TYPE_CHECKING:
+    from glyphar.analysis.quality_assessor import QualityReport
+
 
 UInt8Image = npt.NDArray[np.uint8]
 
@@ -68,7 +72,10 @@ class ConfigOptimizer:
 
     @staticmethod
     def _serialize_config(config: EngineConfig) -> str:
-        return (
+        # Interned: only a handful of distinct configs exist per document, so
+        # every ColumnResult shares one string object per config (less RAM,
+        # and pickle memoizes the repeats when pages go back to the parent).
+        return sys.intern(
             f"{config.pre_type}_"
             f"psm{config.psm}_"
             f"scale{config.scale:.1f}_"
@@ -83,7 +90,9 @@ class ConfigOptimizer:
         self,
         image: UInt8Image,
         layout_type: str,
-        quality_metrics: Mapping[str, Any],
+        quality_metrics: Mapping[str, Any] | QualityReport,
+        gray: UInt8Image | None = None,
+        clean_thresholds: Optional[Tuple[float, float]] = None,
     ) -> Dict[str, Any]:
         """
         Execute OCR with context-aware optimal configuration.
@@ -103,12 +112,21 @@ class ConfigOptimizer:
                 Layout classification value ("single", "double", "complex", etc.)
                 used to determine optimal PSM/OEM configuration.
 
-            quality_metrics (Dict[str, Any]):
-                Dictionary generated by QualityAssessor containing:
+            quality_metrics (QualityReport | Mapping[str, Any]):
+                Metrics generated by QualityAssessor containing:
                     - is_clean_digital (bool): True if native digital PDF extraction
                     - sharpness (float): Laplacian variance or equivalent metric
                     - contrast (float): Normalized contrast measure
 
+            gray (np.ndarray, optional):
+                Pre-converted grayscale view of the same region. When given,
+                preprocessing starts from it instead of re-running BGR→gray;
+                `image` is then only used for the fallback path.
+
+            clean_thresholds (Tuple[float, float], optional):
+                Calibrated (sharpness, contrast) clean-digital gates,
+                forwarded to ConfigStrategy.decide.
+
         Returns:
             Dict[str, Any]:
                 Enriched OCR result dictionary containing:
@@ -172,11 +190,12 @@ class ConfigOptimizer:
         engine_config: EngineConfig = ConfigStrategy.decide(
             layout_type=layout_type,
             quality=quality_metrics,
+            clean_thresholds=clean_thresholds,
         )
 
         # 2. Preprocessing
         processed = ImagePreprocessor.apply(
-            original_image,
+            gray if gray is not None else original_image,
             engine_config.pre_type,
         )
 
@@ -23,7 +23,11 @@ while preserving deterministic behavior.
 """
 
 from dataclasses import dataclass
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from glyphar.analysis.quality_assessor import QualityReport
 
 
 @dataclass(frozen=True)
@@ -51,6 +55,18 @@ class EngineConfig:
     oem: int = 3
 
 
+@lru_cache(maxsize=None)
+def _shared_config(*, pre_type: str, psm: int, scale: float, oem: int) -> EngineConfig:
+    """
+    One shared instance per distinct config.
+
+    decide() only yields a handful of configs (fixed literals per branch);
+    EngineConfig is frozen, so sharing them is safe and skips a dataclass
+    __init__ per region.
+    """
+    return EngineConfig(pre_type=pre_type, psm=psm, scale=scale, oem=oem)
+
+
 class ConfigStrategy:
     """
     Pure strategy selector for OCR engine configuration.
@@ -109,16 +125,30 @@ class ConfigStrategy:
             return default
 
     @staticmethod
-    def decide(layout_type: Any, quality: Mapping[str, Any]) -> EngineConfig:
+    def decide(
+        layout_type: Any,
+        quality: Union[Mapping[str, Any], "QualityReport"],
+        clean_thresholds: Optional[Tuple[float, float]] = None,
+    ) -> EngineConfig:
         """
         Select optimal engine configuration based on document characteristics.
 
         Args:
             layout_type: LayoutType value ("single", "double", etc.)
-            quality: Quality metrics dict from QualityAssessor with keys:
+            quality: QualityReport (or equivalent mapping) with keys:
                 - is_clean_digital: bool
                 - sharpness: float
                 - contrast: float
+            clean_thresholds: Optional calibrated (sharpness, contrast) gates
+                for the clean-digital override. When given they replace both
+                the assessor's is_clean_digital flag and SHARPNESS_HIGH /
+                CONTRAST_HIGH, and the override fires on
+                ``sharpness >= gate and contrast >= gate``. The boundary is
+                inclusive (the assessor's flag uses ``>``) to match
+                fit_clean_thresholds, whose candidate gates are observed
+                sample values; calibration also relies on (0, 0) forcing the
+                fast path whatever the flag says (see
+                PageProcessor.calibrate_clean_thresholds).
 
         Returns:
             EngineConfig with optimal Tesseract parameters.
@@ -132,16 +162,25 @@ class ConfigStrategy:
         sharpness = ConfigStrategy._safe_float(quality.get("sharpness", 0.0))
         contrast = ConfigStrategy._safe_float(quality.get("contrast", 0.0))
 
+        if clean_thresholds is None:
+            sharpness_gate = float(ConfigStrategy.SHARPNESS_HIGH)
+            contrast_gate = ConfigStrategy.CONTRAST_HIGH
+        else:
+            sharpness_gate, contrast_gate = clean_thresholds
+            # Calibrated gates are authoritative: the flag was computed with
+            # a strict ">" (and, during calibration, with default gates)
+            is_clean = True
+
         # ------------------------------------------------------------------
         # 1. STRONG CLEAN DIGITAL OVERRIDE
         # Require high sharpness + high contrast to avoid false positives.
         # ------------------------------------------------------------------
         if (
             is_clean
-            and sharpness >= ConfigStrategy.SHARPNESS_HIGH
-            and contrast >= ConfigStrategy.CONTRAST_HIGH
+            and sharpness >= sharpness_gate
+            and contrast >= contrast_gate
         ):
-            return EngineConfig(
+            return _shared_config(
                 pre_type="gray",
                 psm=3 if normalized_layout == "single" else 4,
                 scale=1.0,
@@ -167,7 +206,7 @@ class ConfigStrategy:
             else:
                 scale = 1.2
 
-            return EngineConfig(
+            return _shared_config(
                 pre_type="adaptive",
                 psm=6,  # Block mode more tolerant to noise
                 scale=scale,
@@ -179,7 +218,7 @@ class ConfigStrategy:
         # ------------------------------------------------------------------
         if contrast < ConfigStrategy.CONTRAST_MEDIUM:
 
-            return EngineConfig(
+            return _shared_config(
                 pre_type="otsu",
                 psm=11 if normalized_layout != "single" else 3,
                 scale=1.2,
@@ -189,7 +228,7 @@ class ConfigStrategy:
         # ------------------------------------------------------------------
         # 5. Conservative default
         # ------------------------------------------------------------------
-        return EngineConfig(
+        return _shared_config(
             pre_type="gray",
             psm=3 if normalized_layout == "single" else 4,
             scale=1.0,
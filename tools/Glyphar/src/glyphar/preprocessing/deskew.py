@@ -41,6 +41,11 @@ class DeskewStrategy(PreprocessingStrategy):
             Prevents over-rotation on noisy inputs.
     """
 
+    # Foreground (ink) share outside which no angle is estimated: near-blank
+    # pages have no text block to measure, near-solid ones no background.
+    MIN_FOREGROUND_RATIO = 0.001
+    MAX_FOREGROUND_RATIO = 0.8
+
     def __init__(self, max_angle: float = 15.0) -> None:
         """
         Initialize deskew strategy.
@@ -62,11 +67,12 @@ class DeskewStrategy(PreprocessingStrategy):
         Algorithm:
             1. Convert to grayscale
             2. Apply Otsu threshold (binary inversion)
-            3. Detect contours
-            4. Select largest contour (assumed main text region)
-            5. Compute minimum-area rectangle
-            6. Extract rotation angle
-            7. Apply affine rotation if within max_angle limit
+            3. Skip near-blank / near-solid pages (foreground ratio)
+            4. Detect contours
+            5. Select largest contour (assumed main text region)
+            6. Compute minimum-area rectangle
+            7. Extract rotation angle
+            8. Apply affine rotation if within max_angle limit
 
         Args:
             image: Input image (color or grayscale).
@@ -74,6 +80,7 @@ class DeskewStrategy(PreprocessingStrategy):
         Returns:
             Rotated image with corrected skew.
             Returns original image if:
+                - Foreground covers <0.1% or >80% of the page
                 - No contours detected
                 - Angle exceeds max_angle
                 - Angle is negligible (<0.5°)
@@ -94,6 +101,12 @@ class DeskewStrategy(PreprocessingStrategy):
             cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU,
         )
 
+        foreground = cv2.countNonZero(binary) / (h * w)
+        if not (
+            self.MIN_FOREGROUND_RATIO <= foreground <= self.MAX_FOREGROUND_RATIO
+        ):
+            return image
+
         contours, _ = cv2.findContours(
             binary,
             cv2.RETR_EXTERNAL,
@@ -126,4 +139,5 @@ class DeskewStrategy(PreprocessingStrategy):
             (w, h),
         )
 
-        return rotated.astype(np.uint8)
+        # warpAffine keeps the input dtype; only convert (copy) if needed
+        return rotated.astype(np.uint8, copy=False)
@@ -7,7 +7,7 @@ import pytest
 np = pytest.importorskip("numpy")
 pytest.importorskip("cv2")
 
-from glyphar.analysis import QualityAssessor
+from glyphar.analysis import QualityAssessor, assess
 
 
 def test_quality_assessor_returns_expected_keys() -> None:
@@ -19,11 +19,13 @@ def test_quality_assessor_returns_expected_keys() -> None:
     assert set(result.keys()) == {
         "sharpness",
         "contrast",
+        "intensity_variance",
         "is_clean_digital",
         "quality_score",
     }
     assert isinstance(result["sharpness"], float)
     assert isinstance(result["contrast"], float)
+    assert isinstance(result["intensity_variance"], float)
     assert isinstance(result["is_clean_digital"], bool)
     assert isinstance(result["quality_score"], float)
 
@@ -36,5 +38,42 @@ def test_quality_assessor_detects_low_quality_uniform_image() -> None:
 
     assert result["sharpness"] == 0.0
     assert result["contrast"] == 0.0
+    assert result["intensity_variance"] == 0.0
     assert result["is_clean_digital"] is False
     assert result["quality_score"] == 0.0
+
+
+def test_quality_assessor_supports_uint16_scans() -> None:
+    """High-bit scans should be assessed without overflowing the Laplacian."""
+    image = np.zeros((64, 64), dtype=np.uint16)
+    image[:, 32:] = 60000
+
+    result = QualityAssessor.assess(image)
+
+    assert result["sharpness"] > 150.0
+    assert result["contrast"] > 0.99
+    assert result["is_clean_digital"] is True
+
+
+def test_quality_report_supports_attribute_and_mapping_access() -> None:
+    """Report is a picklable NamedTuple that still reads like the old dict."""
+    import pickle
+
+    image = np.zeros((64, 64), dtype=np.uint8)
+    image[:, 32:] = 255
+
+    result = QualityAssessor.assess(image)
+
+    assert result.sharpness == result["sharpness"] == result.get("sharpness")
+    assert result.get("missing", 1.5) == 1.5
+    assert pickle.loads(pickle.dumps(result)) == result
+    with pytest.raises(KeyError):
+        _ = result["missing"]
+
+
+def test_module_level_assess_matches_class_wrapper() -> None:
+    """QualityAssessor.assess should delegate to the module-level function."""
+    image = np.zeros((64, 64), dtype=np.uint8)
+    image[16:48, 16:48] = 255
+
+    assert assess(image) == QualityAssessor.assess(image)
@@ -0,0 +1,52 @@
+"""Unit tests for clean-digital threshold calibration."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from glyphar.core.calibration import (
+    DEFAULT_CLEAN_THRESHOLDS,
+    CalibrationSample,
+    fit_clean_thresholds,
+)
+from glyphar.optimization.config_strategy import ConfigStrategy
+
+
+def test_fit_returns_defaults_without_samples() -> None:
+    """No calibration data should keep the shipped gates."""
+    assert fit_clean_thresholds([]) == DEFAULT_CLEAN_THRESHOLDS
+
+
+def test_fit_lowers_gates_when_fast_path_is_as_accurate() -> None:
+    """Pages below the default gates that OCR fine on the fast path get routed there."""
+    samples = [
+        CalibrationSample(100.0, 0.45, 92.0, 1.0, 92.0, 3.0),
+        CalibrationSample(120.0, 0.50, 90.0, 1.0, 90.0, 3.0),
+        CalibrationSample(30.0, 0.20, 20.0, 1.0, 70.0, 3.0),
+    ]
+
+    sharpness, contrast = fit_clean_thresholds(samples)
+    routed_fast = [s.sharpness >= sharpness and s.contrast >= contrast for s in samples]
+
+    assert routed_fast == [True, True, False]
+
+
+def test_fit_keeps_defaults_on_ties() -> None:
+    """Identical outcomes on both paths should not move the gates."""
+    samples = [CalibrationSample(200.0, 0.9, 90.0, 1.0, 90.0, 1.0)]
+
+    assert fit_clean_thresholds(samples) == DEFAULT_CLEAN_THRESHOLDS
+
+
+def test_calibrated_gates_override_strategy_clean_check() -> None:
+    """ConfigStrategy should honour calibrated gates over the assessor flag."""
+    quality = {"is_clean_digital": False, "sharpness": 100.0, "contrast": 0.5}
+
+    default = ConfigStrategy.decide("single", quality)
+    calibrated = ConfigStrategy.decide("single", quality, clean_thresholds=(90.0, 0.4))
+
+    assert default.oem != 1
+    assert calibrated.oem == 1
+    assert calibrated.pre_type == "gray"
@@ -0,0 +1,168 @@
+"""Unit tests for core page processor."""
+
+# pylint: disable=wrong-import-position
+
+from __future__ import annotations
+
+import pickle
+from typing import Any, Mapping
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+from glyphar.core.page_processor import PageProcessor
+from glyphar.analysis.quality_assessor import QualityReport
+from glyphar.models.enums import LayoutType, PageQuality
+
+
+class _Engine:
+    def recognize(self, image: Any, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Return a fixed single-word result."""
+        _ = (image, config)
+        return {
+            "text": "ok",
+            "confidence": 90.0,
+            "words": [{"text": "ok", "bbox": {"left": 1, "top": 2, "width": 10, "height": 5}}],
+        }
+
+
+class _CountingDetector:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def detect(self, image: Any) -> dict[str, Any]:
+        """Single full-page region; counts invocations."""
+        self.calls += 1
+        h, w = image.shape[:2]
+        return {
+            "layout_type": LayoutType.SINGLE,
+            "regions": [{"x": 0, "y": 0, "w": w, "h": h, "col_index": 1}],
+        }
+
+
+def _page(fill: int) -> Any:
+    image = np.full((120, 160, 3), 255, dtype=np.uint8)
+    image[40:60, 20 + fill : 80 + fill] = 0
+    return image
+
+
+def test_page_processor_reuses_analysis_for_identical_pages() -> None:
+    """Repeated pages should skip layout detection; distinct pages should not."""
+    detector = _CountingDetector()
+    processor = PageProcessor(_Engine(), detector)
+
+    first = processor.process(_page(0), 1, "doc", "20260101")
+    second = processor.process(_page(0), 2, "doc", "20260101")
+    processor.process(_page(5), 3, "doc", "20260101")
+
+    assert detector.calls == 2
+    assert first.page_quality == second.page_quality
+    assert second.columns[0].bbox == {"left": 1, "top": 2, "width": 10, "height": 5}
+
+
+def test_page_processor_cache_can_be_disabled_and_pickled() -> None:
+    """analysis_cache_size=0 always re-runs detection; instances stay picklable."""
+    detector = _CountingDetector()
+    processor = PageProcessor(_Engine(), detector, analysis_cache_size=0)
+
+    processor.process(_page(0), 1, "doc", "20260101")
+    processor.process(_page(0), 2, "doc", "20260101")
+
+    assert detector.calls == 2
+    clone = pickle.loads(pickle.dumps(processor))
+    assert clone.process(_page(0), 1, "doc", "20260101").page_confidence_mean == 90.0
+
+
+class _ThreeColumnDetector:
+    def detect(self, image: Any) -> dict[str, Any]:
+        """Three columns of increasing width."""
+        h = image.shape[0]
+        return {
+            "layout_type": LayoutType.MULTI,
+            "regions": [
+                {"x": 0, "y": 0, "w": 20, "h": h, "col_index": 1},
+                {"x": 20, "y": 0, "w": 50, "h": h, "col_index": 2},
+                {"x": 70, "y": 0, "w": 90, "h": h, "col_index": 3},
+            ],
+        }
+
+
+def test_page_processor_region_pool_keeps_layout_order() -> None:
+    """Concurrent region OCR must return columns in layout order, reusing one pool."""
+    processor = PageProcessor(_Engine(), _ThreeColumnDetector(), region_workers=3)
+
+    first = processor.process(_page(0), 1, "doc", "20260101")
+    pool = processor._region_executor  # pylint: disable=protected-access
+    second = processor.process(_page(5), 2, "doc", "20260101")
+
+    assert [c.col_index for c in first.columns] == [1, 2, 3]
+    assert [c.col_index for c in second.columns] == [1, 2, 3]
+    assert processor._region_executor is pool  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    ("sharpness", "contrast", "expected"),
+    [
+        (300.0, 0.7, PageQuality.EXCELLENT),
+        (250.0, 0.7, PageQuality.GOOD),  # gates are strict
+        (300.0, 0.5, PageQuality.GOOD),
+        (160.0, 0.9, PageQuality.GOOD),
+        (100.0, 0.3, PageQuality.FAIR),
+        (300.0, 0.25, PageQuality.POOR),
+        (float("nan"), 0.9, PageQuality.POOR),
+    ],
+)
+def test_classify_page_quality_tiers(
+    sharpness: float, contrast: float, expected: PageQuality
+) -> None:
+    report = QualityReport(sharpness, contrast, 0.0, False, 0.0)
+    assert PageProcessor._classify_page_quality(report) is expected  # pylint: disable=protected-access
+
+
+class _FailingEngine:
+    def recognize(self, image: Any, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Fail every region."""
+        _ = (image, config)
+        raise RuntimeError("engine down")
+
+
+def test_page_processor_failed_region_yields_empty_column() -> None:
+    """A failing region becomes an empty 0.0-confidence column with its geometry."""
+    processor = PageProcessor(_FailingEngine(), _ThreeColumnDetector())
+
+    page = processor.process(_page(0), 1, "doc", "20260101")
+
+    assert [c.col_index for c in page.columns] == [1, 2, 3]
+    column = page.columns[1]
+    assert (column.text, column.confidence, column.word_count) == ("", 0.0, 0)
+    assert column.bbox is not None and column.bbox["left"] == 20
+    assert column.config_used is None
+
+
+class _MalformedDetector:
+    def detect(self, image: Any) -> dict[str, Any]:
+        """One good region among malformed ones."""
+        h = image.shape[0]
+        return {
+            "layout_type": LayoutType.MULTI,
+            "regions": [
+                {"x": 0, "y": 0, "w": 20, "h": h},  # no col_index
+                {"x": "20", "y": 0, "w": 50.0, "h": h, "col_index": 2, "id": "mid"},
+                {"x": 70, "y": 0, "w": 0, "h": h, "col_index": 3},
+            ],
+        }
+
+
+def test_page_processor_drops_malformed_regions_with_warnings() -> None:
+    """Invalid regions never reach OCR; valid ones are coerced to ints."""
+    processor = PageProcessor(_Engine(), _MalformedDetector())
+
+    page = processor.process(_page(0), 1, "doc", "20260101")
+
+    assert [(c.col_index, c.region_id) for c in page.columns] == [(2, "mid")]
+    assert page.columns[0].bbox == {"left": 21, "top": 2, "width": 10, "height": 5}
+    assert len(page.warnings) == 2
+    assert page.warnings[0].startswith("Dropped region 1")
+    assert "w=0" in page.warnings[1]
@@ -0,0 +1,90 @@
+"""Unit tests for core parallel processor worker sizing."""
+
+# pylint: disable=wrong-import-position
+
+from __future__ import annotations
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from glyphar.core import parallel_processor
+from glyphar.core.parallel_processor import (
+    ParallelProcessor,
+    _cgroup_cpu_limit,
+    _worker_cv_threads,
+)
+
+
+def test_cgroup_cpu_limit_reads_v2_and_v1_quotas(tmp_path: Path) -> None:
+    """Quotas round up to whole CPUs; 'max' and -1 mean unlimited."""
+    cpu_max = tmp_path / "cpu.max"
+    missing = str(tmp_path / "absent")
+
+    cpu_max.write_text("250000 100000\n", encoding="ascii")
+    assert _cgroup_cpu_limit(str(cpu_max), missing, missing) == 3
+    cpu_max.write_text("max 100000\n", encoding="ascii")
+    assert _cgroup_cpu_limit(str(cpu_max), missing, missing) is None
+
+    quota, period = tmp_path / "quota", tmp_path / "period"
+    quota.write_text("-1\n", encoding="ascii")
+    period.write_text("100000\n", encoding="ascii")
+    assert _cgroup_cpu_limit(missing, str(quota), str(period)) is None
+    quota.write_text("150000\n", encoding="ascii")
+    assert _cgroup_cpu_limit(missing, str(quota), str(period)) == 2
+    assert _cgroup_cpu_limit(missing, missing, missing) is None
+
+
+def test_parallel_processor_defaults_workers_to_host(monkeypatch: pytest.MonkeyPatch) -> None:
+    """max_workers=None resolves to the host CPU budget minus one."""
+    monkeypatch.setattr(parallel_processor, "_cgroup_cpu_limit", lambda: 2)
+
+    assert ParallelProcessor(None, None).max_workers == 1
+    assert ParallelProcessor(None, None, max_workers=6).max_workers == 6
+
+
+def test_worker_cv_threads_defaults_to_one() -> None:
+    """Workers run OpenCV single-threaded unless GLYPHAR_CV_THREADS says otherwise."""
+    assert _worker_cv_threads(None) == 1
+    assert _worker_cv_threads("") == 1
+    assert _worker_cv_threads("junk") == 1
+    assert _worker_cv_threads("4") == 4
+    assert _worker_cv_threads("0") == 0  # 0 = OpenCV sequential mode
+
+
+class _PagesReader:
+    def read(self, _path: Path) -> list:
+        return [np.zeros((4, 4), dtype=np.uint8)]
+
+
+class _CrashingPageProcessor:
+    def process(self, *_args):
+        os._exit(1)  # simulate a worker killed mid-page
+
+
+class _StubPageProcessor:
+    def process(self, _image, page_number, *_args):
+        return SimpleNamespace(page_number=page_number, page_confidence_mean=90.0)
+
+
+def test_broken_pool_is_rebuilt_on_next_call(tmp_path: Path) -> None:
+    """A worker crash fails that call only; the next call gets a fresh pool."""
+    doc = tmp_path / "doc.pdf"
+    doc.write_bytes(b"")
+
+    with ParallelProcessor(
+        _PagesReader(), _CrashingPageProcessor(), max_workers=1
+    ) as processor:
+        with pytest.raises(BrokenProcessPool):
+            processor.process_parallel(str(doc))
+        assert processor._executor is None
+
+        processor.page_processor = _StubPageProcessor()
+        result = processor.process_parallel(str(doc))
+
+    assert result["processed_pages"] == 1
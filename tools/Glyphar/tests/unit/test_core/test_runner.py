@@ -0,0 +1,72 @@
+"""Unit tests for core page runners."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+import pytest
+
+from glyphar.core.runner import run_parallel, run_sequential
+
+
+class _Processor:
+    def __init__(self) -> None:
+        self.pages: list[int] = []
+
+    def process(self, image: Any, page_number: int, doc_prefix: str, doc_date: str) -> Any:
+        """Record the image; return it in place of a PageResult."""
+        _ = (page_number, doc_prefix, doc_date)
+        self.pages.append(image)
+        return image
+
+
+def test_run_sequential_prefetches_lazy_sources_on_another_thread() -> None:
+    """Iterators are decoded off the OCR thread and keep page order."""
+    producer_threads: set[str] = set()
+
+    def pages() -> Iterator[int]:
+        for n in range(5):
+            producer_threads.add(threading.current_thread().name)
+            yield n
+
+    processor = _Processor()
+    results, _ = run_sequential(pages(), processor, show_progress=False)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert producer_threads == {"page-prefetch"}
+
+
+def test_run_sequential_propagates_source_errors() -> None:
+    """A failing page source surfaces in the caller, after the pages it yielded."""
+
+    def pages() -> Iterator[int]:
+        yield 0
+        raise OSError("renderer crashed")
+
+    processor = _Processor()
+    with pytest.raises(OSError, match="renderer crashed"):
+        run_sequential(pages(), processor, show_progress=False)
+    assert processor.pages == [0]
+
+
+class _PageNumberProcessor:
+    def process(self, image: Any, page_number: int, doc_prefix: str, doc_date: str) -> Any:
+        _ = (image, doc_prefix, doc_date)
+        return SimpleNamespace(page_number=page_number)
+
+
+def test_run_parallel_reports_progress_every_n_pages(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """progress_every prints one line per N completed pages; None stays silent."""
+    results, _ = run_parallel(
+        list(range(25)), _PageNumberProcessor(), max_workers=3, progress_every=10
+    )
+
+    assert [p.page_number for p in results] == list(range(1, 26))
+    assert capsys.readouterr().out.count("páginas concluídas") == 2
+
+    run_parallel(list(range(25)), _PageNumberProcessor(), max_workers=3)
+    assert "páginas concluídas" not in capsys.readouterr().out
@@ -0,0 +1,44 @@
+from glyphar.engines.cached_result import CachedResult
+
+
+def sample_result() -> dict:
+    return {
+        "text": "a b",
+        "confidence": 80.0,
+        "words": [
+            {
+                "text": "a",
+                "confidence": 80.0,
+                "bbox": {"left": 1, "top": 2, "width": 3, "height": 4},
+            },
+            {"text": "b", "confidence": 80.0, "bbox": None},
+        ],
+        "config_used": "--psm 3",
+    }
+
+
+def test_cached_result_round_trips() -> None:
+    result = sample_result()
+
+    assert CachedResult.from_dict(result).to_dict() == result
+
+
+def test_cached_result_is_isolated_from_callers() -> None:
+    result = sample_result()
+    packed = CachedResult.from_dict(result)
+
+    result["words"][1]["text"] = "changed"
+    unpacked = packed.to_dict()
+    unpacked["words"][0]["bbox"]["left"] = 99
+
+    assert packed.to_dict() == sample_result()
+
+
+def test_cached_result_keeps_non_dict_words() -> None:
+    result = sample_result()
+    result["words"] = [("a", 80.0, 1), ("a", 80.0, 1, 2, 3, 4), ["b"]]
+
+    packed = CachedResult.from_dict(result)
+
+    assert packed.to_dict() == result
+    assert packed.to_dict()["words"][1] == ("a", 80.0, 1, 2, 3, 4)
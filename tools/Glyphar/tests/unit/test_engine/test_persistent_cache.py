@@ -0,0 +1,44 @@
+import pickle
+from pathlib import Path
+
+from glyphar.engines.persistent_cache import PersistentOCRCache
+
+
+def test_persistent_cache_round_trips_results(tmp_path: Path) -> None:
+    result = {"text": "Olá", "confidence": 91.5, "words": [{"bbox": {"left": 3}}]}
+    cache = PersistentOCRCache(tmp_path / "ocr.sqlite")
+    cache.set("k", result)
+    cache.close()
+
+    reopened = PersistentOCRCache(tmp_path / "ocr.sqlite")
+
+    assert reopened.get("k") == result
+    assert reopened.get("missing") is None
+    reopened.close()
+
+
+def test_persistent_cache_evicts_least_recently_read(tmp_path: Path) -> None:
+    value = {"text": "x" * 100}
+    cache = PersistentOCRCache(tmp_path / "ocr.sqlite", max_bytes=350)
+
+    cache.set("a", value)
+    cache.set("b", value)
+    cache.set("c", value)
+    assert cache.get("a") == value  # "b" is now least recently read
+    cache.set("d", value)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == value
+    assert cache.get("d") == value
+    cache.close()
+
+
+def test_persistent_cache_pickles_and_reconnects(tmp_path: Path) -> None:
+    cache = PersistentOCRCache(tmp_path / "ocr.sqlite")
+    cache.set("k", {"text": "t"})
+
+    clone = pickle.loads(pickle.dumps(cache))
+
+    assert clone.get("k") == {"text": "t"}
+    cache.close()
+    clone.close()
@@ -0,0 +1,29 @@
+from glyphar.engines.processor import process_ocr_data
+
+
+def test_process_ocr_data_filters_blank_and_low_confidence_words() -> None:
+    data = {
+        "text": ["", "Hello", "  ", "world", "noise", "junk", "tail"],
+        "conf": ["-1", "95", "90", 85.0, "20", "abc"],  # one short: "tail" has none
+        "left": [0, 10, 0, 60, 90, 120, 150],
+        "top": [0, 5, 0, 5, 5, 5, 5],
+        "width": [0, 40, 0, 45, 20, 20, 20],
+        "height": [0, 12, 0, 12, 12, 12, 12],
+    }
+
+    result = process_ocr_data(data, min_confidence=30.0)
+
+    assert [w["text"] for w in result["words"]] == ["Hello", "world"]
+    assert result["words"][1]["bbox"] == {"left": 60, "top": 5, "width": 45, "height": 12}
+    assert result["text"] == "Hello world"
+    assert result["confidence"] == 90.0
+    assert (result["min_word_confidence"], result["max_word_confidence"]) == (85.0, 95.0)
+    assert result["char_count"] == 10
+
+
+def test_process_ocr_data_handles_empty_table() -> None:
+    result = process_ocr_data({}, min_confidence=30.0)
+
+    assert result["words"] == []
+    assert result["confidence"] == 0.0
+    assert result["text"] == ""
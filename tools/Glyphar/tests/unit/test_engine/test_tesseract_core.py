@@ -52,3 +52,19 @@ def test_core_raises_on_tesseract_error(monkeypatch: pytest.MonkeyPatch) -> None
 
     with pytest.raises(RuntimeError):
         engine.recognize(img, {"psm": 3})
+
+
+def test_core_passes_quoted_tessdata_dir(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = TesseractCoreEngine("eng", tessdata_dir="/opt/my models/tessdata")
+    img = np.zeros((50, 200), dtype=np.uint8)
+    seen = {}
+
+    def fake_image_to_data(*args, **kwargs):
+        seen["config"] = kwargs["config"]
+        return fake_output_dict()
+
+    monkeypatch.setattr("pytesseract.image_to_data", fake_image_to_data)
+
+    engine.recognize(img, {"psm": 6})
+
+    assert seen["config"] == "--psm 6 --tessdata-dir '/opt/my models/tessdata'"
@@ -0,0 +1,193 @@
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from glyphar.engines.managed.tesseract_managed import TesseractManagedEngine
+from glyphar.engines.persistent_cache import PersistentOCRCache
+from glyphar.engines.user_files import UserFilesManager
+from glyphar.engines.validation import _resolve_default_tessdata
+
+
+def make_engine(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, cache_size: int
+) -> TesseractManagedEngine:
+    monkeypatch.setattr(UserFilesManager, "DEFAULT_WORDS_PATH", tmp_path / "words.txt")
+    monkeypatch.setattr(UserFilesManager, "_shared", {})
+    engine = TesseractManagedEngine(
+        str(_resolve_default_tessdata()), "por", cache_size=cache_size
+    )
+    engine.core_calls = 0  # type: ignore[attr-defined]
+
+    def fake_recognize(image: Any, config: Dict[str, Any]) -> Dict[str, Any]:
+        engine.core_calls += 1  # type: ignore[attr-defined]
+        return {"words": [{"text": "ok", "conf": 90.0, "bbox": None}]}
+
+    monkeypatch.setattr(engine.core, "recognize", fake_recognize)
+    return engine
+
+
+def page(value: int) -> np.ndarray:
+    return np.full((20, 30), value, dtype=np.uint8)
+
+
+def test_managed_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = make_engine(monkeypatch, tmp_path, cache_size=2)
+
+    engine.recognize(page(1), {})
+    engine.recognize(page(2), {})
+    engine.recognize(page(1), {})  # hit: page 1 becomes most recent
+    engine.recognize(page(3), {})  # evicts page 2
+    engine.recognize(page(1), {})  # still cached
+    engine.recognize(page(2), {})  # miss
+
+    assert engine.core_calls == 4
+    assert len(engine.cache) == 2
+
+
+def test_managed_engine_pickles_with_empty_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = make_engine(monkeypatch, tmp_path, cache_size=2)
+    engine.recognize(page(1), {})
+    monkeypatch.undo()
+
+    clone = pickle.loads(pickle.dumps(engine))
+
+    assert len(clone.cache) == 0
+    assert clone.cache_size == 2
+
+
+def test_managed_engine_writes_user_files_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = make_engine(monkeypatch, tmp_path, cache_size=0)
+    words = tmp_path / "words.txt"
+    assert words.exists()
+
+    words.unlink()
+    engine.recognize(page(1), {})
+
+    assert not words.exists()  # recognize() no longer rewrites dictionaries
+    engine.user_files.cleanup()
+
+
+def test_managed_engine_reuses_persistent_cache_across_instances(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(UserFilesManager, "DEFAULT_WORDS_PATH", tmp_path / "words.txt")
+    monkeypatch.setattr(UserFilesManager, "_shared", {})
+    calls = []
+
+    def fake_recognize(image: Any, config: Dict[str, Any]) -> Dict[str, Any]:
+        calls.append(config)
+        return {"words": [{"text": "ok", "conf": 90.0, "bbox": {"left": 1}}]}
+
+    results = []
+    for _ in range(2):  # second engine simulates a restarted process
+        engine = TesseractManagedEngine(
+            str(_resolve_default_tessdata()),
+            "por",
+            persistent_cache=tmp_path / "ocr.sqlite",
+        )
+        monkeypatch.setattr(engine.core, "recognize", fake_recognize)
+        results.append(engine.recognize(page(7), {}))
+        engine.persistent_cache.close()
+
+    assert len(calls) == 1
+    assert results[1] == results[0]
+    assert engine.stats.cache_hits == 1
+
+
+def failing_engine(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fallback_text: str
+) -> TesseractManagedEngine:
+    engine = make_engine(monkeypatch, tmp_path, cache_size=10)
+    engine.fallback_calls = 0  # type: ignore[attr-defined]
+
+    def fail(image: Any, config: Dict[str, Any]) -> Dict[str, Any]:
+        raise RuntimeError("timeout")
+
+    def fake_fallback(**kwargs: Any) -> Dict[str, Any]:
+        engine.fallback_calls += 1  # type: ignore[attr-defined]
+        if fallback_text:
+            return {"text": fallback_text, "confidence": 30.0, "config_used": "x"}
+        return {"text": "", "confidence": 0.0, "config_used": "failed_all_fallbacks"}
+
+    monkeypatch.setattr(engine.core, "recognize", fail)
+    monkeypatch.setattr(
+        "glyphar.engines.managed.tesseract_managed.apply_fallback_strategy",
+        fake_fallback,
+    )
+    return engine
+
+
+def test_managed_engine_memoizes_fallback_results(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = failing_engine(monkeypatch, tmp_path, "recovered")
+
+    first = engine.recognize(page(1), {})
+    second = engine.recognize(page(1), {})
+
+    assert engine.fallback_calls == 1
+    assert first["from_fallback"] and second["from_fallback"]
+    assert engine.stats.fallback_pages == 1
+    assert len(engine.cache) == 0  # TTL-bound only, like outright failures
+
+
+def test_managed_engine_never_persists_fallback_results(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = failing_engine(monkeypatch, tmp_path, "recovered")
+    engine.persistent_cache = PersistentOCRCache(tmp_path / "ocr.sqlite")
+
+    engine.recognize(page(1), {})
+
+    assert len(engine.persistent_cache) == 0
+    engine.persistent_cache.close()
+
+
+def test_managed_engine_forgets_fallback_failures_after_ttl(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = failing_engine(monkeypatch, tmp_path, "")
+
+    engine.recognize(page(1), {})
+    engine.recognize(page(1), {})
+    assert engine.fallback_calls == 1
+    assert len(engine.cache) == 0
+
+    engine.failure_ttl_s = 0.0
+    engine._failures.clear()
+    engine.recognize(page(1), {})
+    engine.recognize(page(1), {})
+    assert engine.fallback_calls == 3
+
+
+def test_recognize_batch_keeps_order_and_per_image_configs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    engine = make_engine(monkeypatch, tmp_path, cache_size=10)
+    seen = []
+
+    def fake_recognize(image: Any, config: Dict[str, Any]) -> Dict[str, Any]:
+        seen.append(config["psm"])
+        return {"words": [{"text": str(image[0, 0]), "conf": 90.0, "bbox": None}]}
+
+    monkeypatch.setattr(engine.core, "recognize", fake_recognize)
+    images = [page(v) for v in range(6)]
+
+    results = engine.recognize_batch(
+        images, [{"psm": 6}] * 3 + [{"psm": 11}] * 3, max_workers=3
+    )
+
+    assert [r["text"] for r in results] == [str(v) for v in range(6)]
+    assert sorted(seen) == [6, 6, 6, 11, 11, 11]
+    assert engine.stats.total_pages == 6
+    with pytest.raises(ValueError):
+        engine.recognize_batch(images, [{}])
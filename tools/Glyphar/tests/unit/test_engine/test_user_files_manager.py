@@ -67,3 +67,17 @@ def test_context_manager_cleans_files(tmp_path: Path, monkeypatch: pytest.Monkey
 
     assert not (tmp_path / "words.txt").exists()
     assert not (tmp_path / "patterns.txt").exists()
+
+
+def test_shared_returns_one_manager_per_model_type(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(UserFilesManager, "DEFAULT_WORDS_PATH", tmp_path / "words.txt")
+    monkeypatch.setattr(UserFilesManager, "_shared", {})
+
+    fast = UserFilesManager.shared("fast")
+
+    assert UserFilesManager.shared("fast") is fast
+    assert UserFilesManager.shared("best") is not fast
+    with pytest.raises(ValueError):
+        UserFilesManager.shared("ultra")
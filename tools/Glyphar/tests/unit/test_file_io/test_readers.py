@@ -0,0 +1,117 @@
+"""Unit tests for file readers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from glyphar.file_io import readers
+from glyphar.file_io.raster_cache import RasterCache
+from glyphar.file_io.readers import PDFReader
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Dict[str, Any]:
+    """Stub Poppler: a 5-page PDF of 4x6 pages; records each render call."""
+    calls: Dict[str, Any] = {"ranges": []}
+
+    def convert(path: str, **kwargs: Any) -> list:
+        calls.update(kwargs)
+        first, last = kwargs["first_page"], kwargs["last_page"]
+        calls["ranges"].append((first, last))
+        if kwargs.get("grayscale"):
+            return [Image.new("L", (6, 4), color=n) for n in range(first, last + 1)]
+        return [
+            Image.new("RGB", (6, 4), color=(n, 20, 30)) for n in range(first, last + 1)
+        ]
+
+    monkeypatch.setattr(readers, "convert_from_path", convert)
+    monkeypatch.setattr(readers, "pdfinfo_from_path", lambda path: {"Pages": 5})
+    pdf = tmp_path / "doc.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    calls["path"] = pdf
+    return calls
+
+
+def test_pdf_reader_renders_bgr_with_parallel_poppler(fake_pdf: Dict[str, Any]) -> None:
+    pages = PDFReader(dpi=200, thread_count=3).read(fake_pdf["path"])
+
+    assert fake_pdf["thread_count"] == 3
+    assert fake_pdf["use_pdftocairo"] is False
+    assert [page[0, 0].tolist() for page in pages] == [
+        [30, 20, n] for n in range(1, 6)
+    ]
+    assert pages[0].shape == (4, 6, 3)
+
+
+def test_pdf_reader_streams_pages_in_render_batches(fake_pdf: Dict[str, Any]) -> None:
+    pages = PDFReader(thread_count=2).read_iter(fake_pdf["path"])
+
+    assert fake_pdf["ranges"] == []  # nothing rendered until iterated
+    assert next(pages)[0, 0, 2] == 1
+    assert fake_pdf["ranges"] == [(1, 2)]
+    assert [page[0, 0, 2] for page in pages] == [2, 3, 4, 5]
+    assert fake_pdf["ranges"] == [(1, 2), (3, 4), (5, 5)]
+
+
+def test_pdf_reader_checks_path_before_iterating(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        PDFReader().read_iter(tmp_path / "missing.pdf")
+
+
+def test_pdf_reader_grayscale_returns_2d_pages(fake_pdf: Dict[str, Any]) -> None:
+    pages = PDFReader(grayscale=True).read(fake_pdf["path"])
+
+    assert pages[0].shape == (4, 6)
+    assert pages[0].dtype == np.uint8
+    assert pages[0].flags.writeable
+    assert PDFReader().thread_count >= 1
+
+
+def test_pdf_reader_cache_skips_rendering_unchanged_pdf(
+    fake_pdf: Dict[str, Any], tmp_path: Path
+) -> None:
+    reader = PDFReader(thread_count=2, cache=tmp_path / "cache")
+
+    first = reader.read(fake_pdf["path"])
+    renders = len(fake_pdf["ranges"])
+    second = reader.read(fake_pdf["path"])
+
+    assert len(fake_pdf["ranges"]) == renders
+    assert all((a == b).all() for a, b in zip(first, second))
+    assert len(second) == 5
+
+    PDFReader(dpi=150, cache=tmp_path / "cache").read(fake_pdf["path"])
+    assert len(fake_pdf["ranges"]) > renders  # other settings, other entry
+
+
+def test_raster_cache_discards_partial_renders(tmp_path: Path) -> None:
+    cache = RasterCache(tmp_path, max_bytes=10**9)
+    pages = (np.full((2, 2), i, np.uint8) for i in range(3))
+
+    stream = cache.store("k", pages)
+    next(stream)
+    stream.close()
+
+    assert cache.load("k") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_raster_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    page = np.zeros((10, 10), np.uint8)
+    cache = RasterCache(tmp_path, max_bytes=500)  # two 228-byte pages
+
+    list(cache.store("a", [page]))
+    list(cache.store("b", [page]))
+    os.utime(tmp_path / "a", (1, 1))
+    os.utime(tmp_path / "b", (2, 2))
+    list(cache.store("c", [page]))
+
+    assert cache.load("a") is None
+    assert cache.load("b") is not None
+    assert cache.load("c") is not None
@@ -38,3 +38,23 @@ def test_advanced_detector_returns_structured_response() -> None:
         LayoutType.MULTI,
         LayoutType.COMPLEX,
     }
+
+
+def test_advanced_detector_finds_strict_deep_valleys() -> None:
+    """Only strict local minima below mean * ratio count as valleys."""
+    projection = np.array([9, 1, 9, 9, 8, 9, 0, 0, 9, 1, 9], dtype=np.int64)
+
+    assert AdvancedLayoutDetector._find_valleys(projection) == [1, 9]
+    assert AdvancedLayoutDetector._find_valleys(projection[:2]) == []
+
+
+def test_advanced_detector_symmetry_skips_middle_column_of_odd_widths() -> None:
+    """Mirrored halves score 1.0; a fully inverted half scores 0.0."""
+    half = np.array([[0, 255, 30], [7, 200, 90]], dtype=np.uint8)
+    middle = np.full((2, 1), 123, dtype=np.uint8)
+
+    mirrored = np.hstack([half, middle, half[:, ::-1]])
+    inverted = np.hstack([np.zeros((2, 3), np.uint8), np.full((2, 3), 255, np.uint8)])
+
+    assert AdvancedLayoutDetector._calculate_symmetry(mirrored) == 1.0
+    assert AdvancedLayoutDetector._calculate_symmetry(inverted) == 0.0
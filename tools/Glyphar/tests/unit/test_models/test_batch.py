@@ -0,0 +1,53 @@
+"""Unit tests for batch schemas."""
+
+from datetime import datetime, timezone
+
+from glyphar.models.batch import BatchResult, BatchStatus, BatchTask
+from glyphar.models.config import OCRConfig
+
+
+def task(n: int, status: str) -> BatchTask:
+    return BatchTask(
+        task_id=f"t{n}", file_path=f"/docs/{n}.pdf", config=OCRConfig(), status=status
+    )
+
+
+def test_batch_result_groups_tasks_by_status() -> None:
+    tasks = [
+        task(1, BatchStatus.COMPLETED),
+        task(2, BatchStatus.FAILED),
+        task(3, BatchStatus.COMPLETED),
+        task(4, BatchStatus.PENDING),
+    ]
+    batch = BatchResult(
+        batch_id="b", tasks=tasks, started_at=datetime.now(timezone.utc)
+    )
+
+    batch.completed_tasks.clear()  # callers get their own list
+
+    assert [t.task_id for t in batch.completed_tasks] == ["t1", "t3"]
+    assert [t.task_id for t in batch.failed_tasks] == ["t2"]
+    assert batch.success_rate == 50.0
+    assert "_tasks_by_status" not in batch.model_dump()
+
+
+def test_batch_result_without_tasks_has_zero_success_rate() -> None:
+    batch = BatchResult(batch_id="b", tasks=[], started_at=datetime.now(timezone.utc))
+
+    assert batch.success_rate == 0.0
+    assert batch.failed_tasks == []
+
+
+def test_status_queries_follow_tasks_replaced_by_model_copy() -> None:
+    batch = BatchResult(
+        batch_id="b",
+        tasks=[task(1, BatchStatus.COMPLETED)],
+        started_at=datetime.now(timezone.utc),
+    )
+    assert batch.success_rate == 100.0
+
+    replaced = batch.model_copy(update={"tasks": [task(2, BatchStatus.FAILED)]})
+
+    assert replaced.success_rate == 0.0
+    assert [t.task_id for t in replaced.failed_tasks] == ["t2"]
+    assert batch.success_rate == 100.0
@@ -0,0 +1,34 @@
+"""Unit tests for the OCROutput schema."""
+
+from glyphar.models.output import OCROutput
+from glyphar.models.page import PageResult
+
+
+def page(number: int, confidence: float) -> PageResult:
+    return PageResult(
+        id=f"doc_{number}",
+        page_number=number,
+        page_confidence_mean=confidence,
+        processing_time_s=0.1,
+    )
+
+
+def test_high_quality_pages_returns_fresh_lists() -> None:
+    pages = [page(1, 95.0), page(2, 60.0), page(3, 90.0)]
+    output = OCROutput.model_construct(pages=pages)
+
+    first = output.high_quality_pages
+    first.clear()
+
+    assert [p.page_number for p in output.high_quality_pages] == [1, 3]
+    assert "_high_quality_pages" not in output.model_dump()
+
+
+def test_high_quality_pages_follow_pages_replaced_by_model_copy() -> None:
+    output = OCROutput.model_construct(pages=[page(1, 95.0)])
+    assert [p.page_number for p in output.high_quality_pages] == [1]
+
+    replaced = output.model_copy(update={"pages": [page(2, 60.0), page(3, 92.0)]})
+
+    assert [p.page_number for p in replaced.high_quality_pages] == [3]
+    assert [p.page_number for p in output.high_quality_pages] == [1]
@@ -0,0 +1,60 @@
+"""Unit tests for the PageResult schema."""
+
+from glyphar.models.column import ColumnResult
+from glyphar.models.page import PageResult
+
+
+def column(index: int, text: str) -> ColumnResult:
+    return ColumnResult(
+        col_index=index,
+        text=text,
+        confidence=90.0,
+        word_count=len(text.split()),
+        char_count=len(text),
+        processing_time_s=0.1,
+    )
+
+
+def test_get_text_skips_blank_columns() -> None:
+    texts = ["left column", "", " \n\t", "right column", " "]
+    page = PageResult(
+        id="doc_1",
+        page_number=1,
+        columns=[column(i, t) for i, t in enumerate(texts, start=1)],
+        page_confidence_mean=90.0,
+        processing_time_s=0.5,
+    )
+
+    assert page.get_text() == "left column\n\nright column"
+    assert page.get_text(separator=" | ") == "left column | right column"
+
+
+def test_get_text_follows_columns_replaced_by_model_copy() -> None:
+    page = PageResult(
+        id="doc_1",
+        page_number=1,
+        columns=[column(1, "old text")],
+        page_confidence_mean=90.0,
+        processing_time_s=0.5,
+    )
+    assert page.get_text() == "old text"
+
+    replaced = page.model_copy(update={"columns": [column(1, "new text")]})
+
+    assert replaced.get_text() == "new text"
+
+
+def test_totals_follow_columns_replaced_by_model_copy() -> None:
+    page = PageResult(
+        id="doc_1",
+        page_number=1,
+        columns=[column(1, "two words")],
+        page_confidence_mean=90.0,
+        processing_time_s=0.5,
+    )
+    assert (page.total_words, page.total_chars) == (2, 9)
+
+    emptied = page.model_copy(update={"columns": []})
+
+    assert (emptied.total_words, emptied.total_chars) == (0, 0)
+    assert (page.total_words, page.total_chars) == (2, 9)
@@ -65,3 +65,32 @@ def test_optimizer_primary_path_includes_serialized_config() -> None:
     assert result["text"] == "ok"
     assert result["config_used"].startswith("gray_psm3_scale1.0_oem1")
     assert "time_s" in result
+
+
+class _EngineRecordingInput:
+    def __init__(self) -> None:
+        self.images: list[UInt8Image] = []
+
+    def recognize(self, image: UInt8Image, config: Mapping[str, Any]) -> dict[str, Any]:
+        """Record the image handed to the engine."""
+        _ = config
+        self.images.append(image)
+        return {"text": "ok", "confidence": 90.0, "words": []}
+
+
+def test_optimizer_preprocesses_pre_converted_gray_buffer() -> None:
+    """A supplied gray buffer should feed preprocessing instead of the BGR crop."""
+    engine = _EngineRecordingInput()
+    optimizer = ConfigOptimizer(engine)
+    image = np.zeros((100, 200, 3), dtype=np.uint8)
+    gray = np.full((100, 200), 77, dtype=np.uint8)
+
+    optimizer.find_optimal_config(
+        image=image,
+        layout_type="single",
+        quality_metrics={"is_clean_digital": True, "sharpness": 220.0, "contrast": 0.8},
+        gray=gray,
+    )
+
+    assert engine.images[0].ndim == 2
+    assert np.array_equal(engine.images[0], gray)
@@ -9,7 +9,7 @@ import pytest
 pytest.importorskip("numpy")
 pytest.importorskip("cv2")
 
-from glyphar.optimization.config_strategy import ConfigStrategy
+from glyphar.optimization.config_strategy import ConfigStrategy, EngineConfig
 
 
 class _LayoutType(str, Enum):
@@ -47,3 +47,28 @@ def test_decide_supports_layout_enum_input() -> None:
     assert config.psm == 3
     assert config.scale == 1.0
     assert config.oem == 1
+
+
+def test_decide_reuses_shared_config_instances() -> None:
+    """Equal decisions return the same frozen EngineConfig object."""
+    quality = {"is_clean_digital": False, "sharpness": 40.0, "contrast": 0.6}
+
+    first = ConfigStrategy.decide("single", quality)
+    second = ConfigStrategy.decide("single", dict(quality, sharpness=45.0))
+
+    assert first is second
+    assert first == EngineConfig(pre_type="adaptive", psm=6, scale=1.3, oem=3)
+
+
+def test_decide_calibrated_gates_are_inclusive() -> None:
+    """Calibrated gates ignore the assessor flag and admit values on the gate."""
+    quality = {"is_clean_digital": False, "sharpness": 120.0, "contrast": 0.5}
+
+    on_gate = ConfigStrategy.decide("single", quality, clean_thresholds=(120.0, 0.5))
+    above_gate = ConfigStrategy.decide(
+        "single", quality, clean_thresholds=(120.5, 0.5)
+    )
+
+    assert on_gate.pre_type == "gray"
+    assert on_gate.oem == 1
+    assert above_gate.oem != 1
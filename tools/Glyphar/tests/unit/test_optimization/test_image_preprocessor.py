@@ -37,3 +37,20 @@ def test_validate_rejects_invalid_channel_count() -> None:
 
     with pytest.raises(ValueError, match="1, 3 or 4 channels"):
         ImagePreprocessor.apply(image, pre_type="gray")
+
+
+def test_otsu_on_large_image_matches_full_histogram_level() -> None:
+    """Sampled Otsu level agrees with OpenCV's full-image level."""
+    cv2 = pytest.importorskip("cv2")
+    rng = np.random.default_rng(0)
+    image = rng.normal(200, 12, (1200, 1000)).clip(0, 255).astype(np.uint8)
+    image[::40, :] = rng.normal(40, 12, (30, 1000)).clip(0, 255).astype(np.uint8)
+
+    full_level, expected = cv2.threshold(
+        image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU
+    )
+    result = ImagePreprocessor.apply(image, pre_type="otsu")
+
+    assert abs(ImagePreprocessor._otsu_level(image) - full_level) <= 2
+    assert result.dtype == np.uint8
+    assert np.mean(result != expected) < 1e-3
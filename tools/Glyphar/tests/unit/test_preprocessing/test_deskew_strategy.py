@@ -0,0 +1,34 @@
+import numpy as np
+import cv2
+
+from glyphar.preprocessing.deskew import DeskewStrategy
+
+
+def test_deskew_rotates_skewed_block_and_keeps_uint8():
+    image = np.full((400, 400), 255, dtype=np.uint8)
+    box = cv2.boxPoints(((200, 200), (240, 120), 5.0)).astype(np.int32)
+    cv2.fillPoly(image, [box], (0,))
+
+    result = DeskewStrategy(max_angle=15.0).apply(image)
+
+    assert result.dtype == np.uint8
+    assert result.shape == image.shape
+    assert not np.array_equal(result, image)
+
+
+def test_deskew_returns_blank_page_unchanged():
+    image = np.full((100, 100), 255, dtype=np.uint8)
+
+    assert DeskewStrategy().apply(image) is image
+
+
+def test_deskew_skips_pages_with_extreme_foreground_ratio():
+    sparse = np.full((400, 400), 255, dtype=np.uint8)
+    sparse[100:104, 100:120] = 0  # 0.05% ink
+    solid = np.zeros((400, 400), dtype=np.uint8)
+    solid[10:30, 10:30] = 255  # ~97% ink after inversion
+
+    strategy = DeskewStrategy()
+
+    assert strategy.apply(sparse) is sparse
+    assert strategy.apply(solid) is solid